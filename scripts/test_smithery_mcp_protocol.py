@@ -11,202 +11,247 @@ This script tests the MCP initialization endpoints that Smithery.ai scanner expe
 import asyncio
 import json
 import sys
-from typing import Dict, Any
+from contextvars import ContextVar
+from typing import Any, Dict, List, Tuple
 
 import httpx
 
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+def _jsonrpc_body(request_id: int, method: str, params: Dict[str, Any]) -> bytes:
+    """Serialize a JSON-RPC 2.0 request envelope to bytes."""
+    return json.dumps({
+        "jsonrpc": "2.0",
+        "id": request_id,
+        "method": method,
+        "params": params
+    }).encode("utf-8")
+
+
+# The probe requests are static, so their envelopes are serialized once
+_INITIALIZE_BODY = _jsonrpc_body(1, "initialize", {
+    "protocolVersion": "2024-11-05",
+    "capabilities": {}
+})
+_TOOLS_LIST_BODY = _jsonrpc_body(2, "tools/list", {})
+_INVALID_METHOD_BODY = _jsonrpc_body(3, "invalid_method", {})
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+# Per-check output buffer; each concurrent check writes its section in one go
+_log_buffer = ContextVar("_log_buffer", default=None)
+
+
+def log(message: str = "") -> None:
+    """Buffer a line of output for the running check, or print it directly."""
+    buffer = _log_buffer.get()
+    if buffer is None:
+        print(message)
+    else:
+        buffer.append(message)
+
 
 async def test_mcp_initialize(client: httpx.AsyncClient, base_url: str) -> bool:
     """Test MCP initialize request."""
-    print("🔧 Testing MCP initialize request...")
-    
-    initialize_request = {
-        "jsonrpc": "2.0",
-        "id": 1,
-        "method": "initialize",
-        "params": {
-            "protocolVersion": "2024-11-05",
-            "capabilities": {}
-        }
-    }
+    log("🔧 Testing MCP initialize request...")
     
     try:
         response = await client.post(
             f"{base_url}/mcp",
-            json=initialize_request,
-            headers={"Content-Type": "application/json"}
+            content=_INITIALIZE_BODY,
+            headers=_JSON_HEADERS
         )
         
-        print(f"   Status: {response.status_code}")
+        log(f"   Status: {response.status_code}")
         
         if response.status_code != 200:
-            print(f"   ❌ FAIL: Expected 200, got {response.status_code}")
-            print(f"   Response: {response.text}")
+            log(f"   ❌ FAIL: Expected 200, got {response.status_code}")
+            log(f"   Response: {response.text}")
             return False
         
         data = response.json()
-        print(f"   Response: {json.dumps(data, indent=2)}")
+        log(f"   Response: {json.dumps(data, indent=2)}")
         
         # Validate JSON-RPC 2.0 response
         if data.get("jsonrpc") != "2.0":
-            print("   ❌ FAIL: Missing or invalid jsonrpc field")
+            log("   ❌ FAIL: Missing or invalid jsonrpc field")
             return False
         
         if "result" not in data:
-            print("   ❌ FAIL: Missing result field")
+            log("   ❌ FAIL: Missing result field")
             return False
         
         result = data["result"]
         if result.get("protocolVersion") != "2024-11-05":
-            print("   ❌ FAIL: Invalid protocol version")
+            log("   ❌ FAIL: Invalid protocol version")
             return False
         
         if "capabilities" not in result:
-            print("   ❌ FAIL: Missing capabilities")
+            log("   ❌ FAIL: Missing capabilities")
             return False
         
         if "serverInfo" not in result:
-            print("   ❌ FAIL: Missing serverInfo")
+            log("   ❌ FAIL: Missing serverInfo")
             return False
         
         server_info = result["serverInfo"]
         if server_info.get("name") != "MusicBrainz MCP Server":
-            print("   ❌ FAIL: Invalid server name")
+            log("   ❌ FAIL: Invalid server name")
             return False
         
-        print("   ✅ PASS: MCP initialize request successful")
+        log("   ✅ PASS: MCP initialize request successful")
         return True
         
     except Exception as e:
-        print(f"   ❌ FAIL: Exception during initialize test: {e}")
+        log(f"   ❌ FAIL: Exception during initialize test: {e}")
         return False
 
 
 async def test_mcp_tools_list(client: httpx.AsyncClient, base_url: str) -> bool:
     """Test MCP tools/list request."""
-    print("🔧 Testing MCP tools/list request...")
-    
-    tools_request = {
-        "jsonrpc": "2.0",
-        "id": 2,
-        "method": "tools/list",
-        "params": {}
-    }
+    log("🔧 Testing MCP tools/list request...")
     
     try:
         response = await client.post(
             f"{base_url}/mcp",
-            json=tools_request,
-            headers={"Content-Type": "application/json"}
+            content=_TOOLS_LIST_BODY,
+            headers=_JSON_HEADERS
         )
         
-        print(f"   Status: {response.status_code}")
+        log(f"   Status: {response.status_code}")
         
         if response.status_code != 200:
-            print(f"   ❌ FAIL: Expected 200, got {response.status_code}")
-            print(f"   Response: {response.text}")
+            log(f"   ❌ FAIL: Expected 200, got {response.status_code}")
+            log(f"   Response: {response.text}")
             return False
         
         data = response.json()
         
         # Validate JSON-RPC 2.0 response
         if data.get("jsonrpc") != "2.0":
-            print("   ❌ FAIL: Missing or invalid jsonrpc field")
+            log("   ❌ FAIL: Missing or invalid jsonrpc field")
             return False
         
         if "result" not in data:
-            print("   ❌ FAIL: Missing result field")
+            log("   ❌ FAIL: Missing result field")
             return False
         
         result = data["result"]
         if "tools" not in result:
-            print("   ❌ FAIL: Missing tools field")
+            log("   ❌ FAIL: Missing tools field")
             return False
         
         tools = result["tools"]
         if not isinstance(tools, list):
-            print("   ❌ FAIL: Tools field is not a list")
+            log("   ❌ FAIL: Tools field is not a list")
             return False
         
         if len(tools) == 0:
-            print("   ❌ FAIL: No tools found")
+            log("   ❌ FAIL: No tools found")
             return False
         
-        print(f"   Found {len(tools)} tools:")
+        log(f"   Found {len(tools)} tools:")
         for tool in tools:
             if "name" not in tool or "description" not in tool or "inputSchema" not in tool:
-                print(f"   ❌ FAIL: Invalid tool structure: {tool}")
+                log(f"   ❌ FAIL: Invalid tool structure: {tool}")
                 return False
-            print(f"     - {tool['name']}: {tool['description']}")
+            log(f"     - {tool['name']}: {tool['description']}")
         
-        print("   ✅ PASS: MCP tools/list request successful")
+        log("   ✅ PASS: MCP tools/list request successful")
         return True
         
     except Exception as e:
-        print(f"   ❌ FAIL: Exception during tools/list test: {e}")
+        log(f"   ❌ FAIL: Exception during tools/list test: {e}")
         return False
 
 
 async def test_health_endpoint(client: httpx.AsyncClient, base_url: str) -> bool:
     """Test health endpoint."""
-    print("🔧 Testing health endpoint...")
+    log("🔧 Testing health endpoint...")
     
     try:
         response = await client.get(f"{base_url}/health")
         
-        print(f"   Status: {response.status_code}")
+        log(f"   Status: {response.status_code}")
         
         if response.status_code != 200:
-            print(f"   ❌ FAIL: Expected 200, got {response.status_code}")
+            log(f"   ❌ FAIL: Expected 200, got {response.status_code}")
             return False
         
         data = response.json()
         if data.get("status") != "healthy":
-            print(f"   ❌ FAIL: Server not healthy: {data}")
+            log(f"   ❌ FAIL: Server not healthy: {data}")
             return False
         
-        print("   ✅ PASS: Health endpoint successful")
+        log("   ✅ PASS: Health endpoint successful")
         return True
         
     except Exception as e:
-        print(f"   ❌ FAIL: Exception during health test: {e}")
+        log(f"   ❌ FAIL: Exception during health test: {e}")
         return False
 
 
 async def test_invalid_mcp_request(client: httpx.AsyncClient, base_url: str) -> bool:
     """Test invalid MCP request handling."""
-    print("🔧 Testing invalid MCP request handling...")
-    
-    invalid_request = {
-        "jsonrpc": "2.0",
-        "id": 3,
-        "method": "invalid_method",
-        "params": {}
-    }
+    log("🔧 Testing invalid MCP request handling...")
     
     try:
         response = await client.post(
             f"{base_url}/mcp",
-            json=invalid_request,
-            headers={"Content-Type": "application/json"}
+            content=_INVALID_METHOD_BODY,
+            headers=_JSON_HEADERS
         )
         
-        print(f"   Status: {response.status_code}")
+        log(f"   Status: {response.status_code}")
         
         # Should either return None (delegated to FastMCP) or handle gracefully
         # We don't expect a 500 error for unknown methods
         if response.status_code >= 500:
-            print(f"   ❌ FAIL: Server error for unknown method: {response.status_code}")
+            log(f"   ❌ FAIL: Server error for unknown method: {response.status_code}")
             return False
         
-        print("   ✅ PASS: Invalid request handled gracefully")
+        log("   ✅ PASS: Invalid request handled gracefully")
         return True
         
     except Exception as e:
-        print(f"   ❌ FAIL: Exception during invalid request test: {e}")
+        log(f"   ❌ FAIL: Exception during invalid request test: {e}")
         return False
 
 
+# Compliance checks run by main(), in report order
+COMPLIANCE_CHECKS = (
+    ("Health Check", test_health_endpoint),
+    ("MCP Initialize", test_mcp_initialize),
+    ("MCP Tools List", test_mcp_tools_list),
+    ("Invalid Request Handling", test_invalid_mcp_request),
+)
+
+
+async def run_probe(
+    test_name: str,
+    test_func,
+    client: httpx.AsyncClient,
+    base_url: str,
+    semaphore: asyncio.Semaphore
+) -> Tuple[str, bool]:
+    """Run a single compliance test under the shared concurrency cap."""
+    async with semaphore:
+        buffer: List[str] = []
+        token = _log_buffer.set(buffer)
+        log(f"\n📋 Running: {test_name}")
+        try:
+            return test_name, await test_func(client, base_url)
+        except Exception as e:
+            log(f"   ❌ FAIL: Unexpected error: {e}")
+            return test_name, False
+        finally:
+            _log_buffer.reset(token)
+            sys.stdout.write("\n".join(buffer) + "\n")
+
+
 async def main():
     """Run all MCP protocol compliance tests."""
     print("🎵 MusicBrainz MCP Server - Smithery.ai Protocol Compliance Test")
@@ -216,22 +261,12 @@ async def main():
     base_url = "http://localhost:9000"
     
     async with httpx.AsyncClient(timeout=30.0) as client:
-        tests = [
-            ("Health Check", test_health_endpoint),
-            ("MCP Initialize", test_mcp_initialize),
-            ("MCP Tools List", test_mcp_tools_list),
-            ("Invalid Request Handling", test_invalid_mcp_request),
-        ]
-        
-        results = []
-        for test_name, test_func in tests:
-            print(f"\n📋 Running: {test_name}")
-            try:
-                result = await test_func(client, base_url)
-                results.append((test_name, result))
-            except Exception as e:
-                print(f"   ❌ FAIL: Unexpected error: {e}")
-                results.append((test_name, False))
+        # The checks are independent, so run them concurrently (capped at 5 in flight)
+        semaphore = asyncio.Semaphore(5)
+        results = await asyncio.gather(*(
+            run_probe(test_name, test_func, client, base_url, semaphore)
+            for test_name, test_func in COMPLIANCE_CHECKS
+        ))
         
         print("\n" + "=" * 60)
         print("📊 Test Results Summary:")
@@ -257,4 +292,6 @@ async def main():
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     sys.exit(asyncio.run(main()))
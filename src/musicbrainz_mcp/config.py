@@ -192,6 +192,19 @@ class MusicBrainzMCPConfig:
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in configuration file: {e}")
         
+        return cls.from_dict(config_data)
+
+    @classmethod
+    def from_dict(cls, config_data: Dict[str, Any]) -> "MusicBrainzMCPConfig":
+        """
+        Create configuration from a dictionary.
+
+        Args:
+            config_data: Configuration data in the same layout as to_dict()
+
+        Returns:
+            Configuration instance
+        """
         # Create configuration with defaults
         config = cls()
         
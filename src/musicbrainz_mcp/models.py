@@ -13,6 +13,12 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, field_validator, ConfigDict
 
+# MBID (UUID) pattern used to validate model IDs
+MBID_PATTERN = re.compile(
+    r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
+    re.IGNORECASE
+)
+
 
 class MBIDMixin(BaseModel):
     """Mixin for models that have MusicBrainz IDs."""
@@ -25,11 +31,7 @@ class MBIDMixin(BaseModel):
     @classmethod
     def validate_mbid(cls, v: str) -> str:
         """Validate that the ID is a valid UUID format."""
-        uuid_pattern = re.compile(
-            r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-            re.IGNORECASE
-        )
-        if not uuid_pattern.match(v):
+        if not MBID_PATTERN.match(v):
             raise ValueError(f"Invalid MBID format: {v}")
         return v
 
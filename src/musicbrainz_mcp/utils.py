@@ -7,17 +7,37 @@ the main server functionality.
 """
 
 import hashlib
+import heapq
 import json
 import logging
 import re
+import sys
 import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, List, Optional, Union, Tuple
-from urllib.parse import quote, unquote
+from typing import Any, Callable, Dict, List, Optional, Union, Tuple
+from urllib.parse import quote, unquote, urlencode
 
 # Configure module logger
 logger = logging.getLogger(__name__)
 
+# MBID (UUID) patterns, compiled once; matched against hex-lowercased input
+_MBID_PATTERN = r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"
+_MBID_RE = re.compile(_MBID_PATTERN)
+_MBID_IN_TEXT_RE = re.compile(rf"\b{_MBID_PATTERN}\b")
+_HEX_LOWER = str.maketrans("ABCDEF", "abcdef")
+
+# Lucene special characters, each mapped to its backslash-escaped form
+_LUCENE_SPECIAL_CHARS = '+-&|!(){}[]^"~*?:\\'
+_LUCENE_ESCAPE_TABLE = str.maketrans({char: "\\" + char for char in _LUCENE_SPECIAL_CHARS})
+
+# Values treated as empty by DataUtils.clean_dict(remove_empty=True)
+_EMPTY_VALUES: Tuple[Any, ...] = ("", [], {})
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as an ISO 8601 string with a 'Z' suffix."""
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%fZ")
+
 
 class MBIDUtils:
     """Utilities for working with MusicBrainz IDs."""
@@ -36,11 +56,8 @@ class MBIDUtils:
         if not mbid or not isinstance(mbid, str):
             return False
         
-        uuid_pattern = re.compile(
-            r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
-            re.IGNORECASE
-        )
-        return bool(uuid_pattern.match(mbid.strip()))
+        mbid = mbid.strip()
+        return len(mbid) == 36 and _MBID_RE.fullmatch(mbid.translate(_HEX_LOWER)) is not None
     
     @staticmethod
     def normalize_mbid(mbid: str) -> str:
@@ -70,15 +87,9 @@ class MBIDUtils:
             text: Text to search for MBIDs
             
         Returns:
-            List of valid MBIDs found
+            List of unique valid MBIDs found, lowercased, in order of first appearance
         """
-        uuid_pattern = re.compile(
-            r"\b[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\b",
-            re.IGNORECASE
-        )
-        
-        matches = uuid_pattern.findall(text)
-        return [match.lower() for match in matches]
+        return list(dict.fromkeys(_MBID_IN_TEXT_RE.findall(text.translate(_HEX_LOWER))))
 
 
 class ResponseFormatter:
@@ -104,7 +115,7 @@ class ResponseFormatter:
         response = {
             "success": True,
             "data": data,
-            "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+            "timestamp": _utc_timestamp()
         }
         
         if message:
@@ -135,7 +146,7 @@ class ResponseFormatter:
         response = {
             "success": False,
             "error": error,
-            "timestamp": datetime.now(timezone.utc).isoformat().replace('+00:00', 'Z')
+            "timestamp": _utc_timestamp()
         }
         
         if error_code:
@@ -221,17 +232,7 @@ class QueryUtils:
         Returns:
             Escaped query string
         """
-        # Lucene special characters that need escaping
-        special_chars = r'+-&|!(){}[]^"~*?:\\'
-        
-        escaped = ""
-        for char in query:
-            if char in special_chars:
-                escaped += "\\" + char
-            else:
-                escaped += char
-        
-        return escaped
+        return query.translate(_LUCENE_ESCAPE_TABLE)
     
     @staticmethod
     def build_search_query(
@@ -267,15 +268,21 @@ class QueryUtils:
 class CacheUtils:
     """Simple in-memory caching utilities."""
     
-    def __init__(self, default_ttl: int = 300):
+    def __init__(self, default_ttl: int = 300, time_func: Callable[[], float] = time.monotonic):
         """
         Initialize cache with default TTL.
         
         Args:
             default_ttl: Default time-to-live in seconds
+            time_func: Clock used for expiry, in seconds
         """
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # key -> (value, expires_at)
+        self._cache: Dict[str, Tuple[Any, float]] = {}
+        # Min-heap of (expires_at, key); entries superseded by a later set() are
+        # skipped when popped
+        self._heap: List[Tuple[float, str]] = []
         self._default_ttl = default_ttl
+        self._now = time_func
     
     def _generate_key(self, *args, **kwargs) -> str:
         """Generate a cache key from arguments."""
@@ -296,15 +303,15 @@ class CacheUtils:
         Returns:
             Cached value or None if not found/expired
         """
-        if key not in self._cache:
+        entry = self._cache.get(key)
+        if entry is None:
             return None
         
-        entry = self._cache[key]
-        if time.time() > entry["expires_at"]:
+        if self._now() > entry[1]:
             del self._cache[key]
             return None
         
-        return entry["value"]
+        return entry[0]
     
     def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
         """
@@ -318,11 +325,14 @@ class CacheUtils:
         if ttl is None:
             ttl = self._default_ttl
         
-        self._cache[key] = {
-            "value": value,
-            "expires_at": time.time() + ttl,
-            "created_at": time.time()
-        }
+        expires_at = self._now() + ttl
+        self._cache[key] = (value, expires_at)
+        heapq.heappush(self._heap, (expires_at, key))
+
+        # Rebuild the index once stale entries dominate it
+        if len(self._heap) > 2 * len(self._cache) + 16:
+            self._heap = [(entry[1], k) for k, entry in self._cache.items()]
+            heapq.heapify(self._heap)
     
     def delete(self, key: str) -> bool:
         """
@@ -342,6 +352,7 @@ class CacheUtils:
     def clear(self) -> None:
         """Clear all cached values."""
         self._cache.clear()
+        self._heap.clear()
     
     def cleanup_expired(self) -> int:
         """
@@ -350,16 +361,18 @@ class CacheUtils:
         Returns:
             Number of entries removed
         """
-        current_time = time.time()
-        expired_keys = [
-            key for key, entry in self._cache.items()
-            if current_time > entry["expires_at"]
-        ]
+        current_time = self._now()
+        heap = self._heap
+        removed = 0
         
-        for key in expired_keys:
-            del self._cache[key]
+        while heap and current_time > heap[0][0]:
+            expires_at, key = heapq.heappop(heap)
+            entry = self._cache.get(key)
+            if entry is not None and entry[1] == expires_at:
+                del self._cache[key]
+                removed += 1
         
-        return len(expired_keys)
+        return removed
     
     def stats(self) -> Dict[str, Any]:
         """
@@ -368,18 +381,19 @@ class CacheUtils:
         Returns:
             Dictionary with cache statistics
         """
-        current_time = time.time()
+        current_time = self._now()
         expired_count = sum(
             1 for entry in self._cache.values()
-            if current_time > entry["expires_at"]
+            if current_time > entry[1]
         )
         
         return {
             "total_entries": len(self._cache),
             "expired_entries": expired_count,
             "active_entries": len(self._cache) - expired_count,
-            "memory_usage_bytes": sum(
-                len(str(entry)) for entry in self._cache.values()
+            "memory_usage_bytes": sys.getsizeof(self._cache) + sum(
+                sys.getsizeof(key) + sys.getsizeof(entry[0])
+                for key, entry in self._cache.items()
             )
         }
 
@@ -486,19 +500,15 @@ class URLUtils:
         url = f"{base_url}/{endpoint}"
 
         if params:
-            query_parts = []
-            for key, value in params.items():
-                if value is not None:
-                    if isinstance(value, list):
-                        # Handle list parameters (e.g., inc=releases+recordings)
-                        value_str = "+".join(str(v) for v in value)
-                    else:
-                        value_str = str(value)
-
-                    query_parts.append(f"{quote(str(key))}={quote(value_str)}")
+            query = {
+                # Join list parameters with '+' (e.g., inc=releases+recordings)
+                key: "+".join(str(v) for v in value) if isinstance(value, list) else value
+                for key, value in params.items()
+                if value is not None
+            }
 
-            if query_parts:
-                url += "?" + "&".join(query_parts)
+            if query:
+                url += "?" + urlencode(query, safe="/", quote_via=quote)
 
         return url
 
@@ -653,21 +663,26 @@ class DataUtils:
         Returns:
             Flattened dictionary
         """
-        result = {}
-
-        for key, value in data.items():
-            new_key = f"{prefix}{separator}{key}" if prefix else key
+        result: Dict[str, Any] = {}
+        # Explicit (prefix, value, expand_lists) stack instead of recursion.
+        # Children are pushed in reverse so they pop in their original order;
+        # lists nested directly in lists are kept as leaf values.
+        stack: List[Tuple[str, Any, bool]] = [(prefix, data, True)]
 
+        while stack:
+            key, value, expand_lists = stack.pop()
             if isinstance(value, dict):
-                result.update(DataUtils.flatten_dict(value, separator, new_key))
-            elif isinstance(value, list):
-                for i, item in enumerate(value):
-                    if isinstance(item, dict):
-                        result.update(DataUtils.flatten_dict(item, separator, f"{new_key}[{i}]"))
-                    else:
-                        result[f"{new_key}[{i}]"] = item
+                stack.extend(
+                    ((f"{key}{separator}{k}" if key else k), v, True)
+                    for k, v in reversed(list(value.items()))
+                )
+            elif isinstance(value, list) and expand_lists:
+                stack.extend(
+                    (f"{key}[{i}]", item, False)
+                    for i, item in reversed(list(enumerate(value)))
+                )
             else:
-                result[new_key] = value
+                result[key] = value
 
         return result
 
@@ -684,23 +699,15 @@ class DataUtils:
         Returns:
             Cleaned dictionary
         """
-        cleaned = {}
-
-        for key, value in data.items():
-            # Skip None values if requested
-            if remove_none and value is None:
-                continue
-
-            # Skip empty values if requested
-            if remove_empty and value in ("", [], {}):
-                continue
-
-            # Recursively clean nested dictionaries
-            if isinstance(value, dict):
-                cleaned_value = DataUtils.clean_dict(value, remove_none, remove_empty)
-                if cleaned_value or not remove_empty:
-                    cleaned[key] = cleaned_value
-            else:
-                cleaned[key] = value
+        # Recursively clean nested dictionaries first, so a nested dictionary
+        # emptied by cleaning is dropped by the same check as other empty values
+        entries = (
+            (key, DataUtils.clean_dict(value, remove_none, remove_empty) if isinstance(value, dict) else value)
+            for key, value in data.items()
+        )
 
-        return cleaned
+        return {
+            key: value
+            for key, value in entries
+            if not (remove_none and value is None) and not (remove_empty and value in _EMPTY_VALUES)
+        }
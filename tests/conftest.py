@@ -6,22 +6,46 @@ for testing all components of the MusicBrainz MCP server.
 """
 
 import asyncio
+import copy
 import json
 import pytest
 import sys
 import os
+from pytest_asyncio import is_async_test
+from types import MappingProxyType, SimpleNamespace
 from typing import Dict, Any, AsyncGenerator
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import patch
 
 # Add src to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
 from musicbrainz_mcp.musicbrainz_client import MusicBrainzClient
-from musicbrainz_mcp.config import MusicBrainzMCPConfig, APIConfig, CacheConfig
-from musicbrainz_mcp.utils import CacheUtils
+from musicbrainz_mcp.config import MusicBrainzMCPConfig, APIConfig, CacheConfig, set_config
+from musicbrainz_mcp.models import (
+    Artist, Release, Recording, ReleaseGroup, Label, Work,
+    LifeSpan, Area, Alias, ArtistCredit, Medium, Track,
+    SearchResult, BrowseResult, MBID_PATTERN
+)
+from musicbrainz_mcp.utils import CacheUtils, get_cache
 from musicbrainz_mcp.server import create_server
 from fastmcp import Client
 
+# Use uvloop for the test event loop when it is installed
+try:
+    import uvloop
+    _has_uvloop = True
+except ImportError:
+    _has_uvloop = False
+
+
+def is_valid_mbid(value: str) -> bool:
+    """Check whether a string is a well-formed MBID, using the models' pattern."""
+    return isinstance(value, str) and MBID_PATTERN.match(value) is not None
+
+
+# Default configuration built once at import; each test gets a deep copy
+_PRISTINE_CONFIG = MusicBrainzMCPConfig()
+
 
 # Pytest configuration
 def pytest_configure(config):
@@ -40,12 +64,40 @@ def pytest_configure(config):
     )
 
 
+def pytest_collection_modifyitems(items):
+    """Run every async test in the session-scoped event loop."""
+    session_loop = pytest.mark.asyncio(loop_scope="session")
+    for item in items:
+        if is_async_test(item):
+            item.add_marker(session_loop, append=False)
+
+
 @pytest.fixture(scope="session")
-def event_loop():
-    """Create an instance of the default event loop for the test session."""
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def event_loop_policy():
+    """Back the test event loop with uvloop if available."""
+    if _has_uvloop:
+        return uvloop.EventLoopPolicy()
+    return asyncio.DefaultEventLoopPolicy()
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _warm_models():
+    """Validate one instance of each model up front so tests run on warm validators."""
+    mbid = "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d"
+    artist = Artist(id=mbid, name="Warm-up")
+    LifeSpan(begin="1960", end="1970", ended=True)
+    Area(id=mbid, name="Warm-up")
+    Alias(name="Warm-up")
+    credit = ArtistCredit(name="Warm-up", artist=artist)
+    Track(title="Warm-up", position=1)
+    Medium(position=1, format="CD")
+    release = Release(id=mbid, title="Warm-up", **{"artist-credit": [credit]})
+    recording = Recording(id=mbid, title="Warm-up")
+    ReleaseGroup(id=mbid, title="Warm-up")
+    Label(id=mbid, name="Warm-up")
+    Work(id=mbid, title="Warm-up")
+    SearchResult(count=1, offset=0, artists=[artist], releases=[release])
+    BrowseResult(count=1, offset=0, recordings=[recording])
 
 
 @pytest.fixture
@@ -92,21 +144,6 @@ def cache_utils():
     return CacheUtils(default_ttl=60)
 
 
-@pytest.fixture
-async def mock_musicbrainz_client(mock_api_config):
-    """Provide a mocked MusicBrainz client."""
-    client = MusicBrainzClient(
-        user_agent=mock_api_config.user_agent,
-        rate_limit=mock_api_config.rate_limit,
-        timeout=mock_api_config.timeout
-    )
-    
-    # Mock the HTTP client
-    client._session = AsyncMock()
-    
-    return client
-
-
 @pytest.fixture
 async def real_musicbrainz_client(mock_api_config):
     """Provide a real MusicBrainz client for integration tests."""
@@ -120,164 +157,228 @@ async def real_musicbrainz_client(mock_api_config):
         yield client
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def mcp_server():
-    """Provide an MCP server instance for testing."""
+    """Provide the MCP server instance shared by the test session."""
     server = create_server()
     return server
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 async def mcp_client(mcp_server):
-    """Provide an MCP client connected to the test server."""
+    """Provide an MCP client connected to the test server, shared by the session."""
     async with Client(mcp_server) as client:
         yield client
 
 
-# Mock data fixtures
+@pytest.fixture(scope="session")
+async def tool_list(mcp_client):
+    """Provide the server's tool listing, fetched once per session."""
+    return await mcp_client.list_tools()
+
+
+# Environment variables read by the server when it builds its client
+_CLIENT_ENV_VARS = ("MUSICBRAINZ_USER_AGENT", "MUSICBRAINZ_RATE_LIMIT", "MUSICBRAINZ_TIMEOUT")
+
+
 @pytest.fixture
-def mock_artist_data():
-    """Provide mock artist data for testing."""
-    return {
-        "id": "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
-        "name": "The Beatles",
-        "sort-name": "Beatles, The",
-        "disambiguation": "",
-        "type": "Group",
-        "type-id": "e431f5f6-b5d2-343d-8b36-72607fffb74b",
-        "gender": None,
-        "country": "GB",
-        "life-span": {
-            "begin": "1960",
-            "end": "1970",
-            "ended": True
-        },
-        "area": {
-            "id": "8a754a16-0027-3a29-b6d7-2b40ea0481ed",
-            "name": "United Kingdom",
-            "sort-name": "United Kingdom",
-            "iso-3166-1-codes": ["GB"]
-        }
-    }
+def reset_client():
+    """Snapshot and restore the server's client singleton and its environment variables."""
+    import musicbrainz_mcp.server as server_module
+
+    client = server_module._client
+    env = {name: os.environ.get(name) for name in _CLIENT_ENV_VARS}
+    yield
+    server_module._client = client
+    for name, value in env.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+
+def make_fake_mb_client(**returns):
+    """
+    Build a lightweight stand-in for MusicBrainzClient.
+
+    Each keyword becomes an async method returning the given value, or raising
+    it when it is an exception. Calls are recorded in ``calls[name]`` as
+    ``(args, kwargs)`` tuples. A no-op ``close`` is provided unless given.
+    """
+    client = SimpleNamespace()
+    calls = {}
+    for name, value in returns.items():
+        async def _stub(*args, _name=name, _value=value, **kwargs):
+            calls.setdefault(_name, []).append((args, kwargs))
+            if isinstance(_value, BaseException):
+                raise _value
+            return _value
+        setattr(client, name, _stub)
+    if not hasattr(client, "close"):
+        async def _close():
+            pass
+        client.close = _close
+    client.calls = calls
+    return client
 
 
 @pytest.fixture
-def mock_release_data():
-    """Provide mock release data for testing."""
-    return {
-        "id": "f4a261d1-2a31-4d1a-b4b6-7d6e4c8f9a0b",
-        "title": "Abbey Road",
-        "disambiguation": "",
-        "date": "1969-09-26",
-        "country": "GB",
-        "status": "Official",
-        "status-id": "4e304316-386d-3409-af2e-78857eec5cfe",
-        "packaging": "None",
-        "text-representation": {
-            "language": "eng",
-            "script": "Latn"
-        },
-        "artist-credit": [
-            {
+def inject_mb_client():
+    """
+    Install a client on the server module for the duration of a test.
+
+    Yields a setter; the injected client is returned both by get_client() and
+    by the per-session factory used by search_artist. The previous module
+    state is restored afterwards.
+    """
+    import musicbrainz_mcp.server as server_module
+
+    saved = (server_module._client, server_module._client_config, server_module.get_session_client)
+
+    def _set(client):
+        async def _session_client(ctx):
+            return client
+
+        server_module._client = client
+        server_module._client_config = server_module._current_config
+        server_module.get_session_client = _session_client
+
+    yield _set
+    server_module._client, server_module._client_config, server_module.get_session_client = saved
+
+
+# Mock data constants, built once and shared read-only across tests
+_MOCK_ARTIST_DATA = MappingProxyType({
+    "id": "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
+    "name": "The Beatles",
+    "sort-name": "Beatles, The",
+    "disambiguation": "",
+    "type": "Group",
+    "type-id": "e431f5f6-b5d2-343d-8b36-72607fffb74b",
+    "gender": None,
+    "country": "GB",
+    "life-span": {
+        "begin": "1960",
+        "end": "1970",
+        "ended": True
+    },
+    "area": {
+        "id": "8a754a16-0027-3a29-b6d7-2b40ea0481ed",
+        "name": "United Kingdom",
+        "sort-name": "United Kingdom",
+        "iso-3166-1-codes": ["GB"]
+    }
+})
+
+_MOCK_RELEASE_DATA = MappingProxyType({
+    "id": "f4a261d1-2a31-4d1a-b4b6-7d6e4c8f9a0b",
+    "title": "Abbey Road",
+    "disambiguation": "",
+    "date": "1969-09-26",
+    "country": "GB",
+    "status": "Official",
+    "status-id": "4e304316-386d-3409-af2e-78857eec5cfe",
+    "packaging": "None",
+    "text-representation": {
+        "language": "eng",
+        "script": "Latn"
+    },
+    "artist-credit": [
+        {
+            "name": "The Beatles",
+            "artist": {
+                "id": "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
                 "name": "The Beatles",
-                "artist": {
-                    "id": "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
-                    "name": "The Beatles",
-                    "sort-name": "Beatles, The"
-                }
+                "sort-name": "Beatles, The"
             }
-        ]
-    }
+        }
+    ]
+})
+
+_MOCK_RECORDING_DATA = MappingProxyType({
+    "id": "c1a2b3d4-e5f6-7890-abcd-ef1234567890",
+    "title": "Come Together",
+    "disambiguation": "",
+    "length": 259000,  # 4:19 in milliseconds
+    "video": False,
+    "artist-credit": [
+        {
+            "name": "The Beatles",
+            "artist": {
+                "id": "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
+                "name": "The Beatles",
+                "sort-name": "Beatles, The"
+            }
+        }
+    ],
+    "isrcs": ["GBUM71505078"]
+})
+
+_MOCK_SEARCH_RESPONSE = MappingProxyType({
+    "created": "2023-01-01T00:00:00.000Z",
+    "count": 1,
+    "offset": 0,
+    "artists": [
+        {
+            "id": "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
+            "name": "The Beatles",
+            "sort-name": "Beatles, The",
+            "type": "Group",
+            "country": "GB",
+            "score": 100
+        }
+    ]
+})
+
+_MOCK_BROWSE_RESPONSE = MappingProxyType({
+    "release-count": 2,
+    "release-offset": 0,
+    "releases": [
+        {
+            "id": "f4a261d1-2a31-4d1a-b4b6-7d6e4c8f9a0b",
+            "title": "Abbey Road",
+            "date": "1969-09-26",
+            "status": "Official"
+        },
+        {
+            "id": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
+            "title": "Let It Be",
+            "date": "1970-05-08",
+            "status": "Official"
+        }
+    ]
+})
 
 
+# Mock data fixtures
 @pytest.fixture
-def mock_recording_data():
-    """Provide mock recording data for testing."""
-    return {
-        "id": "c1a2b3d4-e5f6-7890-abcd-ef1234567890",
-        "title": "Come Together",
-        "disambiguation": "",
-        "length": 259000,  # 4:19 in milliseconds
-        "video": False,
-        "artist-credit": [
-            {
-                "name": "The Beatles",
-                "artist": {
-                    "id": "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
-                    "name": "The Beatles",
-                    "sort-name": "Beatles, The"
-                }
-            }
-        ],
-        "isrcs": ["GBUM71505078"]
-    }
+def mock_artist_data():
+    """Provide read-only mock artist data for testing."""
+    return _MOCK_ARTIST_DATA
 
 
 @pytest.fixture
-def mock_search_response():
-    """Provide mock search response data."""
-    return {
-        "created": "2023-01-01T00:00:00.000Z",
-        "count": 1,
-        "offset": 0,
-        "artists": [
-            {
-                "id": "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
-                "name": "The Beatles",
-                "sort-name": "Beatles, The",
-                "type": "Group",
-                "country": "GB",
-                "score": 100
-            }
-        ]
-    }
+def mock_release_data():
+    """Provide read-only mock release data for testing."""
+    return _MOCK_RELEASE_DATA
 
 
 @pytest.fixture
-def mock_browse_response():
-    """Provide mock browse response data."""
-    return {
-        "release-count": 2,
-        "release-offset": 0,
-        "releases": [
-            {
-                "id": "f4a261d1-2a31-4d1a-b4b6-7d6e4c8f9a0b",
-                "title": "Abbey Road",
-                "date": "1969-09-26",
-                "status": "Official"
-            },
-            {
-                "id": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
-                "title": "Let It Be",
-                "date": "1970-05-08",
-                "status": "Official"
-            }
-        ]
-    }
+def mock_recording_data():
+    """Provide read-only mock recording data for testing."""
+    return _MOCK_RECORDING_DATA
 
 
 @pytest.fixture
-def mock_http_response():
-    """Provide a mock HTTP response."""
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.headers = {"Content-Type": "application/json"}
-    mock_response.json.return_value = {"test": "data"}
-    mock_response.raise_for_status.return_value = None
-    return mock_response
+def mock_search_response():
+    """Provide read-only mock search response data."""
+    return _MOCK_SEARCH_RESPONSE
 
 
 @pytest.fixture
-def mock_httpx_client():
-    """Provide a mock httpx client."""
-    mock_client = AsyncMock()
-    mock_response = AsyncMock()
-    mock_response.status_code = 200
-    mock_response.headers = {"Content-Type": "application/json"}
-    mock_response.json.return_value = {"test": "data"}
-    mock_response.raise_for_status.return_value = None
-    mock_client.get.return_value = mock_response
-    return mock_client
+def mock_browse_response():
+    """Provide read-only mock browse response data."""
+    return _MOCK_BROWSE_RESPONSE
 
 
 # Utility fixtures
@@ -293,6 +394,12 @@ def invalid_mbid():
     return "invalid-mbid-format"
 
 
+@pytest.fixture(scope="session")
+def mbid_validator():
+    """Provide the shared precompiled MBID validator."""
+    return is_valid_mbid
+
+
 @pytest.fixture
 def sample_search_query():
     """Provide a sample search query."""
@@ -310,16 +417,14 @@ def sample_pagination_params():
 def cleanup_global_state():
     """Clean up global state between tests."""
     # Clear any global cache
-    from musicbrainz_mcp.utils import get_cache
     cache = get_cache()
     cache.clear()
     
     # Reset global config
-    from musicbrainz_mcp.config import set_config, MusicBrainzMCPConfig
-    set_config(MusicBrainzMCPConfig())
+    set_config(copy.deepcopy(_PRISTINE_CONFIG))
     
     yield
     
     # Cleanup after test
     cache.clear()
-    set_config(MusicBrainzMCPConfig())
+    set_config(copy.deepcopy(_PRISTINE_CONFIG))
@@ -1,311 +1,135 @@
 """
 Mock API response data for testing MusicBrainz MCP server.
 
-This module contains realistic mock data that mimics actual MusicBrainz API responses
-for use in unit tests and integration tests.
+This module exposes realistic mock data that mimics actual MusicBrainz API responses
+for use in unit tests and integration tests. The payloads themselves are stored
+in mock_data.json next to this module.
 """
 
-from typing import Dict, Any, List
-
-
-# Artist mock data
-MOCK_ARTIST_BEATLES = {
-    "id": "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
-    "name": "The Beatles",
-    "sort-name": "Beatles, The",
-    "disambiguation": "",
-    "type": "Group",
-    "type-id": "e431f5f6-b5d2-343d-8b36-72607fffb74b",
-    "gender": None,
-    "country": "GB",
-    "life-span": {
-        "begin": "1960",
-        "end": "1970",
-        "ended": True
-    },
-    "area": {
-        "id": "8a754a16-0027-3a29-b6d7-2b40ea0481ed",
-        "name": "United Kingdom",
-        "sort-name": "United Kingdom",
-        "iso-3166-1-codes": ["GB"]
-    },
-    "aliases": [
-        {
-            "name": "Beatles",
-            "sort-name": "Beatles",
-            "type": "Artist name",
-            "primary": True,
-            "locale": "en"
-        }
-    ],
-    "tags": [
-        {"name": "rock", "count": 15},
-        {"name": "pop", "count": 12},
-        {"name": "british", "count": 8}
-    ]
+import sys
+from pathlib import Path
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Tuple
+
+import orjson
+
+
+_MOCK_DATA_PATH = Path(__file__).with_name("mock_data.json")
+
+
+def _intern_strings(obj: Any) -> Any:
+    """Recursively intern dict keys and string values so repeats share one object."""
+    if isinstance(obj, str):
+        return sys.intern(obj)
+    if isinstance(obj, dict):
+        return {sys.intern(key): _intern_strings(value) for key, value in obj.items()}
+    if isinstance(obj, list):
+        return [_intern_strings(item) for item in obj]
+    return obj
+
+
+# Frequently repeated identifiers, shared with the interned payloads
+_BEATLES_ID = sys.intern("b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d")
+_DYLAN_ID = sys.intern("72c536dc-7137-4477-a521-567eeb840fa8")
+_ABBEY_ROAD_RELEASE_ID = sys.intern("f4a261d1-2a31-4d1a-b4b6-7d6e4c8f9a0b")
+_ABBEY_ROAD_RELEASE_GROUP_ID = sys.intern("1c205925-2cfe-35c0-81de-d7ef17df9658")
+_COME_TOGETHER_ID = sys.intern("c1a2b3d4-e5f6-7890-abcd-ef1234567890")
+
+
+def _freeze(obj: Any) -> Any:
+    """Recursively convert dicts to read-only views and lists to tuples."""
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    if isinstance(obj, list):
+        return tuple(_freeze(item) for item in obj)
+    return obj
+
+
+@lru_cache(maxsize=None)
+def _load_mocks() -> Dict[str, Any]:
+    """Parse mock_data.json on first use; every MOCK_* constant shares this result."""
+    return _intern_strings(orjson.loads(_MOCK_DATA_PATH.read_bytes()))
+
+
+# MOCK_* constant -> key in mock_data.json. Constants are materialized lazily by
+# __getattr__ below; payloads are deeply frozen (read-only views and tuples), use
+# mutable_copy() for an editable copy.
+_MOCK_KEYS: Dict[str, str] = {
+    # Artist mock data
+    "MOCK_ARTIST_BEATLES": "artist_beatles",
+    "MOCK_ARTIST_DYLAN": "artist_dylan",
+    # Release mock data
+    "MOCK_RELEASE_ABBEY_ROAD": "release_abbey_road",
+    # Recording mock data
+    "MOCK_RECORDING_COME_TOGETHER": "recording_come_together",
+    # Release Group mock data
+    "MOCK_RELEASE_GROUP_ABBEY_ROAD": "release_group_abbey_road",
+    # Search response mock data
+    "MOCK_ARTIST_SEARCH_RESPONSE": "artist_search_response",
+    "MOCK_RELEASE_SEARCH_RESPONSE": "release_search_response",
+    "MOCK_RECORDING_SEARCH_RESPONSE": "recording_search_response",
+    # Browse response mock data
+    "MOCK_ARTIST_RELEASES_BROWSE_RESPONSE": "artist_releases_browse_response",
+    "MOCK_ARTIST_RECORDINGS_BROWSE_RESPONSE": "artist_recordings_browse_response",
+    # Error response mock data
+    "MOCK_ERROR_RESPONSE_404": "error_response_404",
+    "MOCK_ERROR_RESPONSE_400": "error_response_400",
+    "MOCK_ERROR_RESPONSE_503": "error_response_503",
+    # Rate limit response
+    "MOCK_RATE_LIMIT_RESPONSE": "rate_limit_response",
 }
 
-MOCK_ARTIST_DYLAN = {
-    "id": "72c536dc-7137-4477-a521-567eeb840fa8",
-    "name": "Bob Dylan",
-    "sort-name": "Dylan, Bob",
-    "disambiguation": "",
-    "type": "Person",
-    "type-id": "b6e035f4-3ce9-331c-97df-83397230b0df",
-    "gender": "Male",
-    "country": "US",
-    "life-span": {
-        "begin": "1941-05-24",
-        "end": None,
-        "ended": False
-    },
-    "area": {
-        "id": "489ce91b-6658-3307-9877-795b68554c98",
-        "name": "United States",
-        "sort-name": "United States",
-        "iso-3166-1-codes": ["US"]
-    }
-}
 
-# Release mock data
-MOCK_RELEASE_ABBEY_ROAD = {
-    "id": "f4a261d1-2a31-4d1a-b4b6-7d6e4c8f9a0b",
-    "title": "Abbey Road",
-    "disambiguation": "",
-    "date": "1969-09-26",
-    "country": "GB",
-    "status": "Official",
-    "status-id": "4e304316-386d-3409-af2e-78857eec5cfe",
-    "packaging": "None",
-    "barcode": "077774644020",
-    "text-representation": {
-        "language": "eng",
-        "script": "Latn"
-    },
-    "artist-credit": [
-        {
-            "name": "The Beatles",
-            "joinphrase": "",
-            "artist": {
-                "id": "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
-                "name": "The Beatles",
-                "sort-name": "Beatles, The",
-                "disambiguation": ""
-            }
-        }
-    ],
-    "release-group": {
-        "id": "1c205925-2cfe-35c0-81de-d7ef17df9658",
-        "title": "Abbey Road",
-        "primary-type": "Album"
-    },
-    "media": [
-        {
-            "position": 1,
-            "title": "",
-            "format": "CD",
-            "track-count": 17,
-            "tracks": [
-                {
-                    "id": "track1",
-                    "position": 1,
-                    "title": "Come Together",
-                    "length": 259000,
-                    "number": "1"
-                },
-                {
-                    "id": "track2", 
-                    "position": 2,
-                    "title": "Something",
-                    "length": 182000,
-                    "number": "2"
-                }
-            ]
-        }
-    ]
-}
+def __getattr__(name: str) -> Mapping[str, Any]:
+    """Materialize a MOCK_* constant on first access and cache it on the module."""
+    try:
+        key = _MOCK_KEYS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
 
-# Recording mock data
-MOCK_RECORDING_COME_TOGETHER = {
-    "id": "c1a2b3d4-e5f6-7890-abcd-ef1234567890",
-    "title": "Come Together",
-    "disambiguation": "",
-    "length": 259000,
-    "video": False,
-    "artist-credit": [
-        {
-            "name": "The Beatles",
-            "joinphrase": "",
-            "artist": {
-                "id": "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
-                "name": "The Beatles",
-                "sort-name": "Beatles, The"
-            }
-        }
-    ],
-    "isrcs": ["GBUM71505078"],
-    "releases": [
-        {
-            "id": "f4a261d1-2a31-4d1a-b4b6-7d6e4c8f9a0b",
-            "title": "Abbey Road",
-            "date": "1969-09-26"
-        }
-    ]
-}
+    value = _freeze(_load_mocks()[key])
+    globals()[name] = value
+    return value
 
-# Release Group mock data
-MOCK_RELEASE_GROUP_ABBEY_ROAD = {
-    "id": "1c205925-2cfe-35c0-81de-d7ef17df9658",
-    "title": "Abbey Road",
-    "disambiguation": "",
-    "primary-type": "Album",
-    "primary-type-id": "f529b476-6e62-324f-b0aa-1f3e33d313fc",
-    "secondary-types": [],
-    "first-release-date": "1969-09-26",
-    "artist-credit": [
-        {
-            "name": "The Beatles",
-            "artist": {
-                "id": "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
-                "name": "The Beatles",
-                "sort-name": "Beatles, The"
-            }
-        }
-    ]
-}
 
-# Search response mock data
-MOCK_ARTIST_SEARCH_RESPONSE = {
-    "created": "2023-01-01T00:00:00.000Z",
-    "count": 177437,
-    "offset": 0,
-    "artists": [
-        {
-            "id": "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
-            "name": "The Beatles",
-            "sort-name": "Beatles, The",
-            "type": "Group",
-            "country": "GB",
-            "life-span": {"begin": "1960", "end": "1970", "ended": True},
-            "score": 100,
-            "tags": [{"name": "rock", "count": 15}]
-        },
-        {
-            "id": "f54ba2b2-5a0e-4329-9e01-dc5d2c7b0e6f",
-            "name": "The Beatles Revival Band",
-            "sort-name": "Beatles Revival Band, The",
-            "type": "Group",
-            "score": 85
-        }
-    ]
-}
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_MOCK_KEYS))
 
-MOCK_RELEASE_SEARCH_RESPONSE = {
-    "created": "2023-01-01T00:00:00.000Z",
-    "count": 1234,
-    "offset": 0,
-    "releases": [
-        {
-            "id": "f4a261d1-2a31-4d1a-b4b6-7d6e4c8f9a0b",
-            "title": "Abbey Road",
-            "date": "1969-09-26",
-            "country": "GB",
-            "status": "Official",
-            "artist-credit": [{
-                "name": "The Beatles",
-                "artist": {
-                    "id": "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
-                    "name": "The Beatles"
-                }
-            }],
-            "score": 100
-        }
-    ]
-}
 
-MOCK_RECORDING_SEARCH_RESPONSE = {
-    "created": "2023-01-01T00:00:00.000Z", 
-    "count": 567,
-    "offset": 0,
-    "recordings": [
-        {
-            "id": "c1a2b3d4-e5f6-7890-abcd-ef1234567890",
-            "title": "Come Together",
-            "length": 259000,
-            "artist-credit": [{
-                "name": "The Beatles",
-                "artist": {
-                    "id": "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
-                    "name": "The Beatles"
-                }
-            }],
-            "score": 100
-        }
-    ]
-}
+def _mock(name: str) -> Mapping[str, Any]:
+    """Return a MOCK_* constant, materializing it if needed."""
+    value = globals().get(name)
+    return value if value is not None else __getattr__(name)
 
-# Browse response mock data
-MOCK_ARTIST_RELEASES_BROWSE_RESPONSE = {
-    "release-count": 3106,
-    "release-offset": 0,
-    "releases": [
-        {
-            "id": "f4a261d1-2a31-4d1a-b4b6-7d6e4c8f9a0b",
-            "title": "Abbey Road",
-            "date": "1969-09-26",
-            "status": "Official",
-            "packaging": "None"
-        },
-        {
-            "id": "a1b2c3d4-e5f6-7890-abcd-ef1234567890",
-            "title": "Let It Be",
-            "date": "1970-05-08", 
-            "status": "Official",
-            "packaging": "None"
-        }
-    ]
-}
 
-MOCK_ARTIST_RECORDINGS_BROWSE_RESPONSE = {
-    "recording-count": 1500,
-    "recording-offset": 0,
-    "recordings": [
-        {
-            "id": "c1a2b3d4-e5f6-7890-abcd-ef1234567890",
-            "title": "Come Together",
-            "length": 259000
-        },
-        {
-            "id": "d2e3f4g5-h6i7-8901-bcde-f23456789012",
-            "title": "Something",
-            "length": 182000
-        }
-    ]
+# (kind, entity_type, key) -> name of the MOCK_* constant answering that request.
+# key is the entity ID for lookups, "" for searches and the browsed-by entity
+# type for browses.
+_MOCK_REGISTRY: Dict[Tuple[str, str, str], str] = {
+    ("lookup", "artist", _BEATLES_ID): "MOCK_ARTIST_BEATLES",
+    ("lookup", "artist", _DYLAN_ID): "MOCK_ARTIST_DYLAN",
+    ("lookup", "release", _ABBEY_ROAD_RELEASE_ID): "MOCK_RELEASE_ABBEY_ROAD",
+    ("lookup", "recording", _COME_TOGETHER_ID): "MOCK_RECORDING_COME_TOGETHER",
+    ("lookup", "release-group", _ABBEY_ROAD_RELEASE_GROUP_ID): "MOCK_RELEASE_GROUP_ABBEY_ROAD",
+    ("search", "artist", ""): "MOCK_ARTIST_SEARCH_RESPONSE",
+    ("search", "release", ""): "MOCK_RELEASE_SEARCH_RESPONSE",
+    ("search", "recording", ""): "MOCK_RECORDING_SEARCH_RESPONSE",
+    ("browse", "release", "artist"): "MOCK_ARTIST_RELEASES_BROWSE_RESPONSE",
+    ("browse", "recording", "artist"): "MOCK_ARTIST_RECORDINGS_BROWSE_RESPONSE",
 }
 
-# Error response mock data
-MOCK_ERROR_RESPONSE_404 = {
-    "error": "Not Found",
-    "help": "For usage, please see: https://musicbrainz.org/development/mmd"
-}
-
-MOCK_ERROR_RESPONSE_400 = {
-    "error": "Bad Request",
-    "help": "Invalid query parameters"
-}
+# Shared read-only results for unknown lookups and for searches/browses
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+_EMPTY_SEARCH: Mapping[str, Any] = MappingProxyType({"count": 0, "offset": 0})
 
-MOCK_ERROR_RESPONSE_503 = {
-    "error": "Service Unavailable",
-    "help": "The server is temporarily unavailable"
-}
 
-# Rate limit response
-MOCK_RATE_LIMIT_RESPONSE = {
-    "error": "Your requests are exceeding the allowable rate limit. Please see https://musicbrainz.org/doc/XML_Web_Service/Rate_Limiting for more information."
-}
+def _get_registered(key: Tuple[str, str, str], default: Mapping[str, Any]) -> Mapping[str, Any]:
+    name = _MOCK_REGISTRY.get(key)
+    return _mock(name) if name is not None else default
 
 
-def get_mock_response_by_entity_and_id(entity_type: str, entity_id: str) -> Dict[str, Any]:
+def get_mock_response_by_entity_and_id(entity_type: str, entity_id: str) -> Mapping[str, Any]:
     """
     Get mock response data by entity type and ID.
     
@@ -314,28 +138,12 @@ def get_mock_response_by_entity_and_id(entity_type: str, entity_id: str) -> Dict
         entity_id: Entity ID
         
     Returns:
-        Mock response data
+        Mock response data, or an empty read-only mapping if unknown
     """
-    mock_data_map = {
-        "artist": {
-            "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d": MOCK_ARTIST_BEATLES,
-            "72c536dc-7137-4477-a521-567eeb840fa8": MOCK_ARTIST_DYLAN,
-        },
-        "release": {
-            "f4a261d1-2a31-4d1a-b4b6-7d6e4c8f9a0b": MOCK_RELEASE_ABBEY_ROAD,
-        },
-        "recording": {
-            "c1a2b3d4-e5f6-7890-abcd-ef1234567890": MOCK_RECORDING_COME_TOGETHER,
-        },
-        "release-group": {
-            "1c205925-2cfe-35c0-81de-d7ef17df9658": MOCK_RELEASE_GROUP_ABBEY_ROAD,
-        }
-    }
-    
-    return mock_data_map.get(entity_type, {}).get(entity_id, {})
+    return _get_registered(("lookup", entity_type, entity_id), _EMPTY)
 
 
-def get_mock_search_response(entity_type: str, query: str = "") -> Dict[str, Any]:
+def get_mock_search_response(entity_type: str, query: str = "") -> Mapping[str, Any]:
     """
     Get mock search response by entity type.
     
@@ -344,18 +152,12 @@ def get_mock_search_response(entity_type: str, query: str = "") -> Dict[str, Any
         query: Search query (for filtering mock data)
         
     Returns:
-        Mock search response
+        Mock search response, or an empty result page if unknown
     """
-    search_responses = {
-        "artist": MOCK_ARTIST_SEARCH_RESPONSE,
-        "release": MOCK_RELEASE_SEARCH_RESPONSE,
-        "recording": MOCK_RECORDING_SEARCH_RESPONSE,
-    }
-    
-    return search_responses.get(entity_type, {"count": 0, "offset": 0, f"{entity_type}s": []})
+    return _get_registered(("search", entity_type, ""), _EMPTY_SEARCH)
 
 
-def get_mock_browse_response(entity_type: str, browse_type: str) -> Dict[str, Any]:
+def get_mock_browse_response(entity_type: str, browse_type: str) -> Mapping[str, Any]:
     """
     Get mock browse response.
     
@@ -364,11 +166,19 @@ def get_mock_browse_response(entity_type: str, browse_type: str) -> Dict[str, An
         browse_type: Type of browse operation
         
     Returns:
-        Mock browse response
+        Mock browse response, or an empty result page if unknown
     """
-    if entity_type == "release" and browse_type == "artist":
-        return MOCK_ARTIST_RELEASES_BROWSE_RESPONSE
-    elif entity_type == "recording" and browse_type == "artist":
-        return MOCK_ARTIST_RECORDINGS_BROWSE_RESPONSE
+    return _get_registered(("browse", entity_type, browse_type), _EMPTY_SEARCH)
+
+
+def mutable_copy(obj: Any) -> Any:
+    """
+    Return a deep, mutable copy of mock data.
     
-    return {"count": 0, "offset": 0, f"{entity_type}s": []}
+    Args:
+        obj: Mock payload (read-only views and tuples become dicts and lists)
+
+    Returns:
+        Independent copy built from plain dicts and lists
+    """
+    return orjson.loads(orjson.dumps(obj, default=dict))
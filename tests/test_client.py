@@ -9,6 +9,8 @@ import pytest
 import pytest_asyncio
 import asyncio
 import httpx
+import orjson
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch, MagicMock
 from musicbrainz_mcp.musicbrainz_client import MusicBrainzClient
 from musicbrainz_mcp.exceptions import (
@@ -20,17 +22,42 @@ from tests.mock_data import (
     MOCK_RELEASE_ABBEY_ROAD, MOCK_RELEASE_SEARCH_RESPONSE,
     MOCK_RECORDING_COME_TOGETHER, MOCK_RECORDING_SEARCH_RESPONSE,
     MOCK_ARTIST_RELEASES_BROWSE_RESPONSE, MOCK_ERROR_RESPONSE_404,
-    MOCK_RATE_LIMIT_RESPONSE
+    MOCK_RATE_LIMIT_RESPONSE, mutable_copy
 )
 
 
+# Request object shared by every HTTPStatusError built in this module
+_DUMMY_REQ = MagicMock(name="req")
+
+
+def make_ok_response(payload):
+    """Build a minimal successful HTTP response stub whose body is ``payload`` as JSON."""
+    content = orjson.dumps(payload, default=dict)
+    response = SimpleNamespace(status_code=200, is_success=True, headers={}, content=content)
+    response.json = lambda: orjson.loads(content)
+    response.raise_for_status = lambda: None
+    return response
+
+
+def make_error_response(status_code, reason, payload):
+    """Build an HTTP response mock whose raise_for_status raises HTTPStatusError."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.is_success = False
+    response.json.return_value = payload
+    response.raise_for_status.side_effect = httpx.HTTPStatusError(
+        f"{status_code} {reason}", request=_DUMMY_REQ, response=response
+    )
+    return response
+
+
 @pytest.mark.unit
 class TestMusicBrainzClient:
     """Test cases for MusicBrainzClient."""
 
-    @pytest_asyncio.fixture
-    async def client(self):
-        """Create a test client."""
+    @pytest_asyncio.fixture(scope="module")
+    async def shared_client(self):
+        """Create a test client shared by every test in the module."""
         client = MusicBrainzClient(
             user_agent="TestMusicBrainzMCP/1.0.0",
             rate_limit=10.0,
@@ -40,15 +67,13 @@ class TestMusicBrainzClient:
             yield client
 
     @pytest.fixture
-    def mock_response(self):
-        """Create a mock HTTP response."""
-        response = AsyncMock()
-        response.status_code = 200
-        response.headers = {"Content-Type": "application/json"}
-        response.raise_for_status = MagicMock()
-        return response
-
-    @pytest.mark.asyncio
+    def client(self, shared_client):
+        """Provide the shared client with per-test rate limit state reset."""
+        rate_limit = shared_client.rate_limit
+        shared_client._last_request_time = 0.0
+        yield shared_client
+        shared_client.rate_limit = rate_limit
+
     async def test_client_initialization(self):
         """Test client initialization with default parameters."""
         client = MusicBrainzClient()
@@ -56,7 +81,6 @@ class TestMusicBrainzClient:
         assert client.rate_limit == 1.0
         assert client.timeout == 30.0
 
-    @pytest.mark.asyncio
     async def test_client_custom_parameters(self):
         """Test client initialization with custom parameters."""
         client = MusicBrainzClient(
@@ -68,7 +92,6 @@ class TestMusicBrainzClient:
         assert client.rate_limit == 2.5
         assert client.timeout == 15.0
 
-    @pytest.mark.asyncio
     async def test_context_manager(self):
         """Test client as async context manager."""
         client = MusicBrainzClient()
@@ -80,22 +103,16 @@ class TestMusicBrainzClient:
         # Session should be closed after context exit
         assert client._client is None
 
-    @pytest.mark.asyncio
     @patch('httpx.AsyncClient.get')
     async def test_search_artist_success(self, mock_get, client):
         """Test successful artist search."""
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.is_success = True
-        mock_response.json.return_value = MOCK_ARTIST_SEARCH_RESPONSE
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_ok_response(MOCK_ARTIST_SEARCH_RESPONSE)
 
         # Test search
         result = await client.search_artist("The Beatles", limit=25, offset=0)
 
         # Verify result
-        assert result == MOCK_ARTIST_SEARCH_RESPONSE
+        assert result == mutable_copy(MOCK_ARTIST_SEARCH_RESPONSE)
         assert result["count"] == 177437
         assert len(result["artists"]) == 2
         assert result["artists"][0]["name"] == "The Beatles"
@@ -106,28 +123,20 @@ class TestMusicBrainzClient:
         assert "artist" in call_args[0][0]  # URL contains 'artist'
 
         # Check query parameters
-        params = call_args.kwargs.get('params', {})
-        assert params['query'] == "The Beatles"
-        assert params['limit'] == 25
-        assert params['offset'] == 0
+        expected_params = {"query": "The Beatles", "limit": 25, "offset": 0, "fmt": "json"}
+        assert call_args.kwargs["params"] == expected_params
 
-    @pytest.mark.asyncio
     @patch('httpx.AsyncClient.get')
     async def test_lookup_artist_success(self, mock_get, client):
         """Test successful artist lookup."""
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.is_success = True
-        mock_response.json.return_value = MOCK_ARTIST_BEATLES
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_ok_response(MOCK_ARTIST_BEATLES)
 
         # Test lookup
         mbid = "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d"
         result = await client.lookup_artist(mbid)
 
         # Verify result
-        assert result == MOCK_ARTIST_BEATLES
+        assert result == mutable_copy(MOCK_ARTIST_BEATLES)
         assert result["id"] == mbid
         assert result["name"] == "The Beatles"
 
@@ -136,172 +145,84 @@ class TestMusicBrainzClient:
         call_args = mock_get.call_args
         assert mbid in call_args[0][0]  # URL contains MBID
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method,argument,payload,count_key,expected_count,entities_key,first_title", [
+        ("search_release", "Abbey Road", MOCK_RELEASE_SEARCH_RESPONSE,
+         "count", 1234, "releases", "Abbey Road"),
+        ("search_recording", "Come Together", MOCK_RECORDING_SEARCH_RESPONSE,
+         "count", 567, "recordings", "Come Together"),
+        ("browse_artist_releases", "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
+         MOCK_ARTIST_RELEASES_BROWSE_RESPONSE, "release-count", 3106, "releases", "Abbey Road"),
+    ])
     @patch('httpx.AsyncClient.get')
-    async def test_search_release_success(self, mock_get, client):
-        """Test successful release search."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.is_success = True
-        mock_response.json.return_value = MOCK_RELEASE_SEARCH_RESPONSE
-        mock_get.return_value = mock_response
-
-        result = await client.search_release("Abbey Road")
-
-        assert result == MOCK_RELEASE_SEARCH_RESPONSE
-        assert result["count"] == 1234
-        assert result["releases"][0]["title"] == "Abbey Road"
-
-    @pytest.mark.asyncio
-    @patch('httpx.AsyncClient.get')
-    async def test_search_recording_success(self, mock_get, client):
-        """Test successful recording search."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.is_success = True
-        mock_response.json.return_value = MOCK_RECORDING_SEARCH_RESPONSE
-        mock_get.return_value = mock_response
-
-        result = await client.search_recording("Come Together")
-
-        assert result == MOCK_RECORDING_SEARCH_RESPONSE
-        assert result["count"] == 567
-        assert result["recordings"][0]["title"] == "Come Together"
-
-    @pytest.mark.asyncio
-    @patch('httpx.AsyncClient.get')
-    async def test_browse_artist_releases_success(self, mock_get, client):
-        """Test successful browse artist releases."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.is_success = True
-        mock_response.json.return_value = MOCK_ARTIST_RELEASES_BROWSE_RESPONSE
-        mock_get.return_value = mock_response
-
-        artist_mbid = "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d"
-        result = await client.browse_artist_releases(artist_mbid)
-
-        assert result == MOCK_ARTIST_RELEASES_BROWSE_RESPONSE
-        assert result["release-count"] == 3106
-        assert len(result["releases"]) == 2
-
-    @pytest.mark.asyncio
-    @patch('httpx.AsyncClient.get')
-    async def test_http_404_error(self, mock_get, client):
-        """Test handling of 404 Not Found errors."""
-        # Setup mock response for 404
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-        mock_response.is_success = False
-        mock_response.json.return_value = MOCK_ERROR_RESPONSE_404
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "404 Not Found", request=MagicMock(), response=mock_response
-        )
-        mock_get.return_value = mock_response
-
-        # Test that MusicBrainzNotFoundError is raised
-        with pytest.raises(MusicBrainzNotFoundError):
-            await client.lookup_artist("b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d")
-
-    @pytest.mark.asyncio
-    @patch('httpx.AsyncClient.get')
-    async def test_rate_limit_error(self, mock_get, client):
-        """Test handling of rate limit errors."""
-        # Setup mock response for rate limit
-        mock_response = MagicMock()
-        mock_response.status_code = 503
-        mock_response.is_success = False
-        mock_response.json.return_value = MOCK_RATE_LIMIT_RESPONSE
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "503 Service Unavailable", request=MagicMock(), response=mock_response
-        )
-        mock_get.return_value = mock_response
-
-        # Test that MusicBrainzRateLimitError is raised
-        with pytest.raises(MusicBrainzRateLimitError):
-            await client.search_artist("test")
-
-    @pytest.mark.asyncio
-    @patch('httpx.AsyncClient.get')
-    async def test_generic_http_error(self, mock_get, client):
-        """Test handling of generic HTTP errors."""
-        # Setup mock response for 500 error
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-        mock_response.is_success = False
-        mock_response.json.return_value = {"error": "Internal Server Error"}
-        mock_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-            "500 Internal Server Error", request=MagicMock(), response=mock_response
-        )
-        mock_get.return_value = mock_response
-
-        # Test that MusicBrainzError is raised
-        with pytest.raises(MusicBrainzError):
-            await client.search_artist("test")
-
-    @pytest.mark.asyncio
-    @patch('httpx.AsyncClient.get')
-    async def test_network_timeout(self, mock_get, client):
-        """Test handling of network timeouts."""
-        # Setup mock to raise timeout
-        mock_get.side_effect = httpx.TimeoutException("Request timed out")
-
-        # Test that MusicBrainzError is raised
-        with pytest.raises(MusicBrainzError) as exc_info:
-            await client.search_artist("test")
-
-        assert "timed out" in str(exc_info.value).lower()
+    async def test_request_success(
+        self, mock_get, client, method, argument, payload, count_key, expected_count,
+        entities_key, first_title
+    ):
+        """Test successful search and browse requests return the API payload."""
+        mock_get.return_value = make_ok_response(payload)
+
+        result = await getattr(client, method)(argument)
+
+        assert result == mutable_copy(payload)
+        assert result[count_key] == expected_count
+        assert len(result[entities_key]) == len(payload[entities_key])
+        assert result[entities_key][0]["title"] == first_title
+        mock_get.assert_called_once()
 
-    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method,response,side_effect,expected_exc,message", [
+        ("lookup_artist", make_error_response(404, "Not Found", MOCK_ERROR_RESPONSE_404),
+         None, MusicBrainzNotFoundError, None),
+        ("search_artist", make_error_response(503, "Service Unavailable", MOCK_RATE_LIMIT_RESPONSE),
+         None, MusicBrainzRateLimitError, None),
+        ("search_artist", make_error_response(500, "Internal Server Error",
+                                              {"error": "Internal Server Error"}),
+         None, MusicBrainzError, None),
+        ("search_artist", None, httpx.TimeoutException("Request timed out"),
+         MusicBrainzError, "timed out"),
+        ("search_artist", None, httpx.ConnectError("Connection failed"),
+         MusicBrainzError, "connection"),
+    ], ids=["404", "rate-limit", "500", "timeout", "connect-error"])
     @patch('httpx.AsyncClient.get')
-    async def test_network_connection_error(self, mock_get, client):
-        """Test handling of network connection errors."""
-        # Setup mock to raise connection error
-        mock_get.side_effect = httpx.ConnectError("Connection failed")
+    async def test_request_error(
+        self, mock_get, client, method, response, side_effect, expected_exc, message
+    ):
+        """Test that HTTP and network errors map to the client's exceptions."""
+        mock_get.return_value = response
+        mock_get.side_effect = side_effect
 
-        # Test that MusicBrainzError is raised
-        with pytest.raises(MusicBrainzError) as exc_info:
-            await client.search_artist("test")
+        argument = "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d" if method == "lookup_artist" else "test"
+        with pytest.raises(expected_exc) as exc_info:
+            await getattr(client, method)(argument)
 
-        assert "connection" in str(exc_info.value).lower()
+        if message is not None:
+            assert message in str(exc_info.value).lower()
 
-    @pytest.mark.asyncio
     async def test_rate_limiting_delay(self, client):
         """Test that rate limiting introduces appropriate delays."""
         # Set a high rate limit for testing
         client.rate_limit = 100.0  # 100 requests per second
 
-        # Mock the HTTP call to return immediately
-        with patch.object(client._client, 'get') as mock_get:
-            mock_response = MagicMock()
-            mock_response.status_code = 200
-            mock_response.is_success = True
-            mock_response.json.return_value = MOCK_ARTIST_SEARCH_RESPONSE
-            mock_get.return_value = mock_response
-
-            # Make multiple requests and measure timing
-            import time
-            start_time = time.time()
+        # Mock the HTTP call, freeze the rate limiter's clock and mock its sleep,
+        # so the result does not depend on wall time between the two requests
+        frozen_clock = SimpleNamespace(time=lambda: 1000.0)
+        with patch.object(client._client, 'get') as mock_get, \
+                patch('musicbrainz_mcp.musicbrainz_client.time', frozen_clock), \
+                patch('musicbrainz_mcp.musicbrainz_client.asyncio.sleep',
+                      new_callable=AsyncMock) as mock_sleep:
+            mock_get.return_value = make_ok_response(MOCK_ARTIST_SEARCH_RESPONSE)
 
             await client.search_artist("test1")
             await client.search_artist("test2")
 
-            end_time = time.time()
-            elapsed = end_time - start_time
-
-            # Should have some delay due to rate limiting
-            # With 100 req/sec, minimum delay between requests is 0.01 seconds
-            assert elapsed >= 0.01
+            # The second request should wait out the full 0.01s interval
+            mock_sleep.assert_awaited_once()
+            sleep_time = mock_sleep.await_args[0][0]
+            assert sleep_time == pytest.approx(0.01)
 
-    @pytest.mark.asyncio
     @patch('httpx.AsyncClient.get')
     async def test_include_parameters(self, mock_get, client):
         """Test that include parameters are properly formatted."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.is_success = True
-        mock_response.json.return_value = MOCK_ARTIST_BEATLES
-        mock_get.return_value = mock_response
+        mock_get.return_value = make_ok_response(MOCK_ARTIST_BEATLES)
 
         # Test lookup with include parameters
         mbid = "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d"
@@ -314,11 +235,9 @@ class TestMusicBrainzClient:
         call_args = mock_get.call_args
 
         # Check query parameters
-        params = call_args.kwargs.get('params', {})
-        assert 'inc' in params
-        assert params['inc'] == "releases+recordings+release-groups"
+        expected_params = {"inc": "releases+recordings+release-groups", "fmt": "json"}
+        assert call_args.kwargs["params"] == expected_params
 
-    @pytest.mark.asyncio
     async def test_invalid_parameters(self, client):
         """Test handling of invalid parameters."""
         # Test invalid limit
@@ -332,7 +251,6 @@ class TestMusicBrainzClient:
         with pytest.raises(MusicBrainzValidationError):
             await client.search_artist("test", offset=-1)
 
-    @pytest.mark.asyncio
     async def test_empty_query_handling(self, client):
         """Test handling of empty search queries."""
         with pytest.raises(MusicBrainzValidationError):
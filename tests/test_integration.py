@@ -8,10 +8,16 @@ real API calls, server functionality, and end-to-end workflows.
 import pytest
 import pytest_asyncio
 import asyncio
+import copy
+import functools
 import os
 import json
-from unittest.mock import patch, AsyncMock, MagicMock
+import httpx
+import orjson
+from types import SimpleNamespace
+from unittest.mock import patch, AsyncMock
 from fastmcp import Client
+from musicbrainz_mcp import server as server_module
 from musicbrainz_mcp.server import create_server
 from musicbrainz_mcp.musicbrainz_client import MusicBrainzClient
 from musicbrainz_mcp.config import MusicBrainzMCPConfig, set_config
@@ -19,29 +25,97 @@ from musicbrainz_mcp.utils import get_cache
 from tests.mock_data import MOCK_ARTIST_SEARCH_RESPONSE, MOCK_ARTIST_BEATLES
 
 
+# Configuration data shared by the dict and file configuration tests
+_FILE_CONFIG_DATA = {
+    "api": {
+        "rate_limit": 3.0,
+        "timeout": 20.0
+    },
+    "cache": {
+        "enabled": True,
+        "default_ttl": 120
+    },
+    "debug": False
+}
+
+
+@pytest.fixture(scope="session")
+def integration_config():
+    """Configuration for the mocked server integration tests."""
+    config = MusicBrainzMCPConfig()
+    config.api.rate_limit = 10.0  # Higher rate limit for testing
+    config.cache.enabled = True
+    config.debug = True
+    return config
+
+
+# Real MusicBrainz API tests only run when explicitly enabled
+requires_real_api = pytest.mark.skipif(
+    not os.getenv("RUN_MB_REAL_API"),
+    reason="real API tests disabled (set RUN_MB_REAL_API=1 to enable)"
+)
+
+# Response bodies served by the mock API, serialized once at import
+_SEARCH_BODY = orjson.dumps(MOCK_ARTIST_SEARCH_RESPONSE, default=dict)
+_BEATLES_BODY = orjson.dumps(MOCK_ARTIST_BEATLES, default=dict)
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+class MockMusicBrainzAPI:
+    """MockTransport handler serving the mock payloads and counting requests."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.calls += 1
+        # /ws/2/artist is a search, /ws/2/artist/<mbid> is a lookup
+        if request.url.path.rstrip("/").endswith("/artist"):
+            return httpx.Response(200, content=_SEARCH_BODY, headers=_JSON_HEADERS)
+        return httpx.Response(200, content=_BEATLES_BODY, headers=_JSON_HEADERS)
+
+
+@pytest_asyncio.fixture(scope="class")
+async def mock_api_transport():
+    """Route every MusicBrainz client created in a test class through a MockTransport."""
+    api = MockMusicBrainzAPI()
+    transport = httpx.MockTransport(api)
+    async_client = functools.partial(httpx.AsyncClient, transport=transport)
+    # Close the server's cached client so lookups build one on the mock transport,
+    # and again afterwards so later classes do not reuse it
+    await server_module.cleanup()
+    with patch('musicbrainz_mcp.musicbrainz_client.httpx.AsyncClient', async_client):
+        yield api
+    await server_module.cleanup()
+
+
+@pytest.fixture
+def mock_api(mock_api_transport):
+    """Provide the mock API with its request counter reset for this test."""
+    mock_api_transport.calls = 0
+    return mock_api_transport
+
+
 @pytest.mark.integration
 class TestMCPServerIntegration:
     """Test complete MCP server integration."""
 
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(scope="module")
     async def server(self):
-        """Create test server with test configuration."""
-        # Set up test configuration
-        config = MusicBrainzMCPConfig()
-        config.api.rate_limit = 10.0  # Higher rate limit for testing
-        config.cache.enabled = True
-        config.debug = True
-        set_config(config)
-
+        """Create test server, shared by the module."""
         return create_server()
 
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(scope="module")
     async def client(self, server):
-        """Create test client connected to server."""
-        async with Client(server) as client:
+        """Create test client connected to server, shared by the module."""
+        # Enter the client once; the MCP handshake is not repeated per test
+        client = Client(server)
+        await client.__aenter__()
+        try:
             yield client
+        finally:
+            await client.__aexit__(None, None, None)
 
-    @pytest.mark.asyncio
     async def test_server_startup_and_tools(self, client):
         """Test server startup and tool availability."""
         # Test that server starts and tools are available
@@ -59,17 +133,8 @@ class TestMCPServerIntegration:
         for expected_tool in expected_tools:
             assert expected_tool in tool_names
 
-    @pytest.mark.asyncio
-    @patch('musicbrainz_mcp.musicbrainz_client.httpx.AsyncClient.get')
-    async def test_end_to_end_search_workflow(self, mock_get, client):
+    async def test_end_to_end_search_workflow(self, mock_api, client):
         """Test complete search workflow from client to API."""
-        # Setup mock HTTP response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.is_success = True
-        mock_response.json.return_value = MOCK_ARTIST_SEARCH_RESPONSE
-        mock_get.return_value = mock_response
-
         # Test search workflow
         result = await client.call_tool("search_artist", {
             "params": {
@@ -83,19 +148,10 @@ class TestMCPServerIntegration:
         assert result is not None
 
         # Verify that HTTP request was made
-        mock_get.assert_called_once()
+        assert mock_api.calls == 1
 
-    @pytest.mark.asyncio
-    @patch('musicbrainz_mcp.musicbrainz_client.httpx.AsyncClient.get')
-    async def test_end_to_end_lookup_workflow(self, mock_get, client):
+    async def test_end_to_end_lookup_workflow(self, mock_api, client):
         """Test complete lookup workflow from client to API."""
-        # Setup mock HTTP response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.is_success = True
-        mock_response.json.return_value = MOCK_ARTIST_BEATLES
-        mock_get.return_value = mock_response
-
         # Test lookup workflow
         mbid = "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d"
         result = await client.call_tool("get_artist_details", {
@@ -109,20 +165,19 @@ class TestMCPServerIntegration:
         assert result is not None
 
         # Verify that HTTP request was made with correct parameters
-        mock_get.assert_called_once()
+        assert mock_api.calls == 1
 
-    @pytest.mark.asyncio
-    async def test_configuration_integration(self, client):
+    async def test_configuration_integration(self, client, integration_config):
         """Test that configuration is properly integrated."""
         from musicbrainz_mcp.config import get_config
 
+        set_config(copy.deepcopy(integration_config))
         config = get_config()
         assert config is not None
         assert config.api.rate_limit == 10.0  # From test setup
         assert config.cache.enabled is True
         assert config.debug is True
 
-    @pytest.mark.asyncio
     async def test_cache_integration(self, client):
         """Test that caching is properly integrated."""
         cache = get_cache()
@@ -134,7 +189,6 @@ class TestMCPServerIntegration:
         # Clear cache for other tests
         cache.clear()
 
-    @pytest.mark.asyncio
     async def test_error_propagation(self, client):
         """Test that errors are properly propagated through the stack."""
         # Test with invalid MBID format
@@ -148,6 +202,7 @@ class TestMCPServerIntegration:
 
 @pytest.mark.integration
 @pytest.mark.slow
+@requires_real_api
 class TestRealAPIIntegration:
     """Test integration with real MusicBrainz API (slow tests)."""
 
@@ -163,7 +218,6 @@ class TestRealAPIIntegration:
         async with client:
             yield client
 
-    @pytest.mark.asyncio
     @pytest.mark.api
     async def test_real_artist_search(self, real_client):
         """Test real artist search (requires internet)."""
@@ -184,7 +238,6 @@ class TestRealAPIIntegration:
         except Exception as e:
             pytest.skip(f"Real API test skipped due to: {e}")
 
-    @pytest.mark.asyncio
     @pytest.mark.api
     async def test_real_artist_lookup(self, real_client):
         """Test real artist lookup (requires internet)."""
@@ -200,52 +253,61 @@ class TestRealAPIIntegration:
         except Exception as e:
             pytest.skip(f"Real API test skipped due to: {e}")
 
-    @pytest.mark.asyncio
-    @pytest.mark.api
-    async def test_real_rate_limiting(self, real_client):
-        """Test that rate limiting works with real API."""
-        try:
-            import time
 
-            # Make multiple requests and measure timing
-            start_time = time.time()
+@pytest.mark.integration
+class TestRateLimitIntegration:
+    """Test client rate limiting against the mock API on a fake clock."""
+
+    async def test_rate_limiting(self):
+        """Test that consecutive requests are spaced by the rate limit."""
+        clock = SimpleNamespace(now=1000.0)
 
-            await real_client.search_artist("test1", limit=1)
-            await real_client.search_artist("test2", limit=1)
-            await real_client.search_artist("test3", limit=1)
+        async def fake_sleep(seconds):
+            clock.now += seconds
 
-            end_time = time.time()
-            elapsed = end_time - start_time
+        client = MusicBrainzClient(
+            user_agent="TestMusicBrainzMCP/1.0.0",
+            rate_limit=1.0,  # Same limit as the real API
+            timeout=10.0
+        )
+        client._client = httpx.AsyncClient(transport=httpx.MockTransport(MockMusicBrainzAPI()))
 
-            # With 1 req/sec rate limit, 3 requests should take at least 2 seconds
-            assert elapsed >= 2.0
+        # Replace the limiter's clock and sleep so no real time passes
+        with patch('musicbrainz_mcp.musicbrainz_client.time',
+                   SimpleNamespace(time=lambda: clock.now)), \
+                patch('musicbrainz_mcp.musicbrainz_client.asyncio.sleep',
+                      new_callable=AsyncMock, side_effect=fake_sleep) as mock_sleep:
+            async with client:
+                await client.search_artist("test1", limit=1)
+                await client.search_artist("test2", limit=1)
+                await client.search_artist("test3", limit=1)
 
-        except Exception as e:
-            pytest.skip(f"Real API test skipped due to: {e}")
+        # With 1 req/sec rate limit, 3 requests should wait at least 2 seconds
+        assert mock_sleep.await_count == 2
+        assert sum(call.args[0] for call in mock_sleep.await_args_list) >= 2.0
 
 
 @pytest.mark.integration
+@requires_real_api
 class TestMCPServerWithRealAPI:
     """Test MCP server with real API integration."""
 
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(scope="module")
     async def server_with_real_api(self):
-        """Create server configured for real API testing."""
-        config = MusicBrainzMCPConfig()
-        config.api.user_agent = "TestMusicBrainzMCP/1.0.0"
-        config.api.rate_limit = 1.0  # Respect real API limits
-        config.cache.enabled = True
-        set_config(config)
-
+        """Create server for real API testing, shared by the module."""
         return create_server()
 
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(scope="module")
     async def client_with_real_api(self, server_with_real_api):
-        """Create client connected to server with real API."""
-        async with Client(server_with_real_api) as client:
+        """Create client connected to server with real API, shared by the module."""
+        # Enter the client once; the MCP handshake is not repeated per test
+        client = Client(server_with_real_api)
+        await client.__aenter__()
+        try:
             yield client
+        finally:
+            await client.__aexit__(None, None, None)
 
-    @pytest.mark.asyncio
     @pytest.mark.api
     @pytest.mark.slow
     async def test_mcp_server_real_search(self, client_with_real_api):
@@ -264,7 +326,6 @@ class TestMCPServerWithRealAPI:
         except Exception as e:
             pytest.skip(f"Real API test skipped due to: {e}")
 
-    @pytest.mark.asyncio
     @pytest.mark.api
     @pytest.mark.slow
     async def test_mcp_server_real_lookup(self, client_with_real_api):
@@ -288,33 +349,24 @@ class TestMCPServerWithRealAPI:
 class TestCacheIntegration:
     """Test cache integration across components."""
 
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(scope="module")
     async def server_with_cache(self):
-        """Create server with caching enabled."""
-        config = MusicBrainzMCPConfig()
-        config.cache.enabled = True
-        config.cache.default_ttl = 60
-        set_config(config)
-
+        """Create server for cache testing, shared by the module."""
         return create_server()
 
-    @pytest_asyncio.fixture
+    @pytest_asyncio.fixture(scope="module")
     async def client_with_cache(self, server_with_cache):
-        """Create client with caching enabled."""
-        async with Client(server_with_cache) as client:
+        """Create client with caching enabled, shared by the module."""
+        # Enter the client once; the MCP handshake is not repeated per test
+        client = Client(server_with_cache)
+        await client.__aenter__()
+        try:
             yield client
+        finally:
+            await client.__aexit__(None, None, None)
 
-    @pytest.mark.asyncio
-    @patch('musicbrainz_mcp.musicbrainz_client.httpx.AsyncClient.get')
-    async def test_cache_behavior_in_server(self, mock_get, client_with_cache):
+    async def test_cache_behavior_in_server(self, mock_api, client_with_cache):
         """Test that caching works properly in server context."""
-        # Setup mock response
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.is_success = True
-        mock_response.json.return_value = MOCK_ARTIST_SEARCH_RESPONSE
-        mock_get.return_value = mock_response
-
         # Make the same request twice
         params = {
             "params": {
@@ -338,57 +390,41 @@ class TestCacheIntegration:
 class TestConfigurationIntegration:
     """Test configuration integration across components."""
 
-    def test_environment_configuration_integration(self):
+    def test_environment_configuration_integration(self, monkeypatch):
         """Test that environment configuration works end-to-end."""
-        # Set environment variables
-        os.environ["MUSICBRAINZ_RATE_LIMIT"] = "5.0"
-        os.environ["CACHE_ENABLED"] = "false"
-        os.environ["DEBUG"] = "true"
+        # Set environment variables (restored automatically after the test)
+        monkeypatch.setenv("MUSICBRAINZ_RATE_LIMIT", "5.0")
+        monkeypatch.setenv("CACHE_ENABLED", "false")
+        monkeypatch.setenv("DEBUG", "true")
         
-        try:
-            # Load configuration from environment
-            config = MusicBrainzMCPConfig.from_env()
-            
-            assert config.api.rate_limit == 5.0
-            assert config.cache.enabled is False
-            assert config.debug is True
-            
-        finally:
-            # Clean up environment variables
-            del os.environ["MUSICBRAINZ_RATE_LIMIT"]
-            del os.environ["CACHE_ENABLED"]
-            del os.environ["DEBUG"]
+        # Load configuration from environment
+        config = MusicBrainzMCPConfig.from_env()
+
+        assert config.api.rate_limit == 5.0
+        assert config.cache.enabled is False
+        assert config.debug is True
+
+    def test_dict_configuration_integration(self):
+        """Test that dictionary configuration works end-to-end."""
+        config = MusicBrainzMCPConfig.from_dict(_FILE_CONFIG_DATA)
+
+        assert config.api.rate_limit == 3.0
+        assert config.api.timeout == 20.0
+        assert config.cache.enabled is True
+        assert config.cache.default_ttl == 120
+        assert config.debug is False
 
-    def test_file_configuration_integration(self):
+    def test_file_configuration_integration(self, tmp_path):
         """Test that file configuration works end-to-end."""
-        # Create temporary config file
-        config_data = {
-            "api": {
-                "rate_limit": 3.0,
-                "timeout": 20.0
-            },
-            "cache": {
-                "enabled": True,
-                "default_ttl": 120
-            },
-            "debug": False
-        }
+        # Write the config file into pytest's per-test temporary directory
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps(_FILE_CONFIG_DATA), encoding="utf-8")
         
-        import tempfile
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(config_data, f)
-            temp_path = f.name
+        # Load configuration from file
+        config = MusicBrainzMCPConfig.from_file(config_path)
         
-        try:
-            # Load configuration from file
-            config = MusicBrainzMCPConfig.from_file(temp_path)
-            
-            assert config.api.rate_limit == 3.0
-            assert config.api.timeout == 20.0
-            assert config.cache.enabled is True
-            assert config.cache.default_ttl == 120
-            assert config.debug is False
-            
-        finally:
-            # Clean up temporary file
-            os.unlink(temp_path)
+        assert config.api.rate_limit == 3.0
+        assert config.api.timeout == 20.0
+        assert config.cache.enabled is True
+        assert config.cache.default_ttl == 120
+        assert config.debug is False
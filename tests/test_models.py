@@ -18,44 +18,68 @@ from tests.mock_data import (
 )
 
 
+# Models built once from the mock data and shared by read-only tests
+@pytest.fixture(scope="module")
+def beatles_artist():
+    """Artist model built from MOCK_ARTIST_BEATLES."""
+    return Artist(**MOCK_ARTIST_BEATLES)
+
+
+@pytest.fixture(scope="module")
+def abbey_road_release():
+    """Release model built from MOCK_RELEASE_ABBEY_ROAD."""
+    return Release(**MOCK_RELEASE_ABBEY_ROAD)
+
+
+@pytest.fixture(scope="module")
+def come_together_recording():
+    """Recording model built from MOCK_RECORDING_COME_TOGETHER."""
+    return Recording(**MOCK_RECORDING_COME_TOGETHER)
+
+
+@pytest.fixture(scope="module")
+def beatles_search_result(beatles_artist):
+    """SearchResult holding the shared Beatles artist."""
+    return SearchResult(count=1, offset=0, artists=[beatles_artist])
+
+
 @pytest.mark.unit
 class TestMBIDValidation:
     """Test MBID validation in models."""
 
-    def test_valid_mbid(self):
+    @pytest.mark.parametrize("mbid", [
+        "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
+        "B10BBBFC-CF9E-42E0-BE17-E2C3E1D2600D",  # Case insensitive
+    ])
+    def test_valid_mbid(self, mbid):
         """Test that valid MBIDs are accepted."""
-        valid_mbid = "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d"
-        artist = Artist(id=valid_mbid, name="Test Artist")
-        assert artist.id == valid_mbid
-
-    def test_invalid_mbid_format(self):
-        """Test that invalid MBID formats are rejected."""
-        invalid_mbids = [
-            "invalid-mbid",
-            "b10bbbfc-cf9e-42e0-be17",  # Too short
-            "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d-extra",  # Too long
-            "g10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",  # Invalid character
-            "",  # Empty
-            "B10BBBFC-CF9E-42E0-BE17-E2C3E1D2600D"  # Should work (case insensitive)
-        ]
-        
-        # Most should fail
-        for mbid in invalid_mbids[:-1]:  # Exclude the last one (uppercase)
-            with pytest.raises(ValidationError):
-                Artist(id=mbid, name="Test Artist")
-        
-        # Uppercase should work (case insensitive)
-        artist = Artist(id=invalid_mbids[-1], name="Test Artist")
-        assert artist.id == invalid_mbids[-1]
+        artist = Artist(id=mbid, name="Test Artist")
+        assert artist.id == mbid
+
+    @pytest.mark.parametrize("mbid", [
+        "invalid-mbid",
+        "b10bbbfc-cf9e-42e0-be17",  # Too short
+        "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d-extra",  # Too long
+        "g10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",  # Invalid character
+        "",  # Empty
+    ])
+    def test_invalid_mbid_format(self, mbid, mbid_validator):
+        """Test that invalid MBID formats do not match the model's MBID pattern."""
+        assert not mbid_validator(mbid)
+
+    def test_invalid_mbid_rejected_by_model(self):
+        """Test that the model validator rejects an invalid MBID."""
+        with pytest.raises(ValidationError):
+            Artist(id="invalid-mbid", name="Test Artist")
 
 
 @pytest.mark.unit
 class TestArtistModel:
     """Test Artist model validation and serialization."""
 
-    def test_artist_from_mock_data(self):
-        """Test creating Artist from mock API data."""
-        artist = Artist(**MOCK_ARTIST_BEATLES)
+    def test_artist_full_lifecycle(self, beatles_artist):
+        """Test creating, serializing and round-tripping Artist from mock API data."""
+        artist = beatles_artist
         
         assert artist.id == "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d"
         assert artist.name == "The Beatles"
@@ -69,6 +93,20 @@ class TestArtistModel:
         assert artist.life_span.end == "1970"
         assert artist.life_span.ended is True
 
+        # Test serialization
+        data = artist.model_dump(by_alias=True)
+        assert data["id"] == "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d"
+        assert data["name"] == "The Beatles"
+        assert "life-span" in data
+
+        json_str = artist.model_dump_json()
+        assert "The Beatles" in json_str
+        assert "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d" in json_str
+
+        # Test round trip
+        restored = Artist(**data)
+        assert restored.model_dump() == artist.model_dump()
+
     def test_artist_minimal_data(self):
         """Test Artist with minimal required data."""
         artist = Artist(
@@ -82,21 +120,13 @@ class TestArtistModel:
         assert artist.disambiguation == ""
         assert artist.type is None
 
-    def test_artist_serialization(self):
-        """Test Artist model serialization."""
-        artist = Artist(**MOCK_ARTIST_BEATLES)
-        data = artist.model_dump()
-        
-        assert isinstance(data, dict)
-        assert data["id"] == "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d"
-        assert data["name"] == "The Beatles"
-        assert "life_span" in data
-
     def test_artist_with_extra_fields(self):
         """Test that Artist handles extra fields gracefully."""
-        data = MOCK_ARTIST_BEATLES.copy()
-        data["unknown_field"] = "unknown_value"
-        data["score"] = 100  # Common in search results
+        data = {
+            **MOCK_ARTIST_BEATLES,
+            "unknown_field": "unknown_value",
+            "score": 100,  # Common in search results
+        }
         
         # Should not raise error due to extra='ignore'
         artist = Artist(**data)
@@ -107,9 +137,9 @@ class TestArtistModel:
 class TestReleaseModel:
     """Test Release model validation and serialization."""
 
-    def test_release_from_mock_data(self):
+    def test_release_from_mock_data(self, abbey_road_release):
         """Test creating Release from mock API data."""
-        release = Release(**MOCK_RELEASE_ABBEY_ROAD)
+        release = abbey_road_release
         
         assert release.id == "f4a261d1-2a31-4d1a-b4b6-7d6e4c8f9a0b"
         assert release.title == "Abbey Road"
@@ -117,9 +147,9 @@ class TestReleaseModel:
         assert release.country == "GB"
         assert release.status == "Official"
 
-    def test_release_with_media(self):
+    def test_release_with_media(self, abbey_road_release):
         """Test Release with media information."""
-        release = Release(**MOCK_RELEASE_ABBEY_ROAD)
+        release = abbey_road_release
         
         assert release.media is not None
         assert len(release.media) == 1
@@ -129,9 +159,9 @@ class TestReleaseModel:
         assert medium.format == "CD"
         assert medium.track_count == 17
 
-    def test_release_artist_credits(self):
+    def test_release_artist_credits(self, abbey_road_release):
         """Test Release with artist credits."""
-        release = Release(**MOCK_RELEASE_ABBEY_ROAD)
+        release = abbey_road_release
         
         assert release.artist_credit is not None
         assert len(release.artist_credit) == 1
@@ -145,18 +175,18 @@ class TestReleaseModel:
 class TestRecordingModel:
     """Test Recording model validation and serialization."""
 
-    def test_recording_from_mock_data(self):
+    def test_recording_from_mock_data(self, come_together_recording):
         """Test creating Recording from mock API data."""
-        recording = Recording(**MOCK_RECORDING_COME_TOGETHER)
+        recording = come_together_recording
         
         assert recording.id == "c1a2b3d4-e5f6-7890-abcd-ef1234567890"
         assert recording.title == "Come Together"
         assert recording.length == 259000
         assert recording.video is False
 
-    def test_recording_with_isrcs(self):
+    def test_recording_with_isrcs(self, come_together_recording):
         """Test Recording with ISRC codes."""
-        recording = Recording(**MOCK_RECORDING_COME_TOGETHER)
+        recording = come_together_recording
         
         assert recording.isrcs is not None
         assert len(recording.isrcs) == 1
@@ -207,14 +237,9 @@ class TestLifeSpanModel:
 class TestSearchResultModel:
     """Test SearchResult model validation."""
 
-    def test_search_result_artists(self):
+    def test_search_result_artists(self, beatles_search_result):
         """Test SearchResult with artist data."""
-        artists = [Artist(**MOCK_ARTIST_BEATLES)]
-        search_result = SearchResult(
-            count=1,
-            offset=0,
-            artists=artists
-        )
+        search_result = beatles_search_result
         
         assert search_result.count == 1
         assert search_result.offset == 0
@@ -229,16 +254,10 @@ class TestSearchResultModel:
         assert search_result.artists is None
         assert search_result.releases is None
 
-    def test_search_result_mixed_entities(self):
+    def test_search_result_mixed_entities(self, beatles_search_result, abbey_road_release):
         """Test SearchResult with multiple entity types."""
-        artists = [Artist(**MOCK_ARTIST_BEATLES)]
-        releases = [Release(**MOCK_RELEASE_ABBEY_ROAD)]
-        
-        search_result = SearchResult(
-            count=2,
-            offset=0,
-            artists=artists,
-            releases=releases
+        search_result = beatles_search_result.model_copy(
+            update={"count": 2, "releases": [abbey_road_release]}
         )
         
         assert search_result.count == 2
@@ -250,40 +269,20 @@ class TestSearchResultModel:
 class TestModelSerialization:
     """Test model serialization and deserialization."""
 
-    def test_artist_round_trip(self):
-        """Test Artist serialization and deserialization."""
-        original = Artist(**MOCK_ARTIST_BEATLES)
+    @pytest.mark.parametrize("model_cls,fixture_name", [
+        (Release, "abbey_road_release"),
+        (Recording, "come_together_recording"),
+    ])
+    def test_model_round_trip(self, model_cls, fixture_name, request):
+        """Test model serialization and deserialization."""
+        original = request.getfixturevalue(fixture_name)
 
-        # Use model_dump with by_alias=True to preserve field names
+        # Use model_dump with by_alias=True to preserve API field names
         data = original.model_dump(by_alias=True)
-        restored = Artist(**data)
-
-        assert original.id == restored.id
-        assert original.name == restored.name
-
-        # The life_span should be preserved with proper serialization
-        if original.life_span is not None:
-            assert restored.life_span is not None
-            assert original.life_span.begin == restored.life_span.begin
-
-    def test_release_round_trip(self):
-        """Test Release serialization and deserialization."""
-        original = Release(**MOCK_RELEASE_ABBEY_ROAD)
-        data = original.model_dump()
-        restored = Release(**data)
-        
-        assert original.id == restored.id
-        assert original.title == restored.title
-        assert original.date == restored.date
+        restored = model_cls(**data)
 
-    def test_model_json_serialization(self):
-        """Test JSON serialization of models."""
-        artist = Artist(**MOCK_ARTIST_BEATLES)
-        json_str = artist.model_dump_json()
-        
-        assert isinstance(json_str, str)
-        assert "The Beatles" in json_str
-        assert "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d" in json_str
+        assert restored.id == original.id
+        assert restored.model_dump() == original.model_dump()
 
 
 @pytest.mark.unit
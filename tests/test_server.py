@@ -6,12 +6,13 @@ with the MusicBrainz client using mocked responses.
 """
 
 import pytest
-import pytest_asyncio
-import asyncio
-from unittest.mock import AsyncMock, patch, MagicMock
-from fastmcp import Client
-from musicbrainz_mcp.server import create_server, get_client
+import re
+from pydantic import ValidationError
+from musicbrainz_mcp.server import (
+    get_client, SearchParams, LookupParams, BrowseParams, GenericLookupParams
+)
 from musicbrainz_mcp.exceptions import MusicBrainzError
+from tests.conftest import make_fake_mb_client
 from tests.mock_data import (
     MOCK_ARTIST_SEARCH_RESPONSE, MOCK_RELEASE_SEARCH_RESPONSE,
     MOCK_RECORDING_SEARCH_RESPONSE, MOCK_ARTIST_BEATLES,
@@ -19,29 +20,33 @@ from tests.mock_data import (
     MOCK_ARTIST_RELEASES_BROWSE_RESPONSE, MOCK_ARTIST_RECORDINGS_BROWSE_RESPONSE
 )
 
+# Terms matched against lowercased tool descriptions
+_MUSIC_TERMS_RE = re.compile(r"musicbrainz|music|artist|release|recording|mbid")
+_EXAMPLE_RE = re.compile(r"example|e\.g\.|such as")
+
+
+@pytest.fixture
+def server(mcp_server):
+    """Provide the session-wide test server."""
+    return mcp_server
+
+
+@pytest.fixture
+def client(mcp_client):
+    """Provide the session-wide test client connected to the server."""
+    return mcp_client
+
 
 @pytest.mark.unit
 class TestMCPServerTools:
     """Test MCP server tool functionality."""
 
-    @pytest_asyncio.fixture
-    async def server(self):
-        """Create test server."""
-        return create_server()
-
-    @pytest_asyncio.fixture
-    async def client(self, server):
-        """Create test client connected to server."""
-        async with Client(server) as client:
-            yield client
-
-    @pytest.mark.asyncio
-    async def test_server_creation(self, server):
+    def test_server_creation(self, server):
         """Test that server is created successfully."""
         assert server is not None
         assert server.name == "MusicBrainz MCP Server"
 
-    @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_list_tools(self, client):
         """Test listing available tools."""
         tools = await client.list_tools()
@@ -58,88 +63,30 @@ class TestMCPServerTools:
         for expected_tool in expected_tools:
             assert expected_tool in tool_names
 
-    @pytest.mark.asyncio
-    @patch('musicbrainz_mcp.server.get_client')
-    async def test_search_artist_tool(self, mock_get_client, client):
-        """Test search_artist tool."""
-        # Setup mock client
-        mock_client = AsyncMock()
-        mock_client.search_artist.return_value = MOCK_ARTIST_SEARCH_RESPONSE
-        mock_get_client.return_value = mock_client
-
-        # Call tool
-        result = await client.call_tool("search_artist", {
-            "params": {
-                "query": "The Beatles",
-                "limit": 10,
-                "offset": 0
-            }
-        })
-
-        # Verify result
+    @pytest.mark.parametrize("tool, query, params, mock_response, expected_paging", [
+        ("search_artist", "The Beatles", {"limit": 10, "offset": 0},
+         MOCK_ARTIST_SEARCH_RESPONSE, {"limit": 10, "offset": 0}),
+        ("search_release", "Abbey Road", {"limit": 5},
+         MOCK_RELEASE_SEARCH_RESPONSE, {"limit": 5, "offset": 0}),  # Default offset
+        ("search_recording", "Come Together", {"limit": 15, "offset": 10},
+         MOCK_RECORDING_SEARCH_RESPONSE, {"limit": 15, "offset": 10}),
+    ], ids=["artist", "release", "recording"])
+    async def test_search_tool(self, tool, query, params, mock_response, expected_paging,
+                               inject_mb_client, client):
+        """Test the search tools forward their parameters to the client."""
+        mock_client = make_fake_mb_client(**{tool: mock_response})
+        inject_mb_client(mock_client)
+
+        result = await client.call_tool(tool, {"params": {"query": query, **params}})
+
+        # FastMCP Client returns the raw result; we mainly check the client call
         assert result is not None
-        # Note: FastMCP Client returns the raw result, so we need to check the structure
-        # The actual result format depends on how FastMCP handles tool responses
-
-        # Verify mock was called correctly
-        mock_client.search_artist.assert_called_once_with(
-            query="The Beatles",
-            limit=10,
-            offset=0
-        )
-
-    @pytest.mark.asyncio
-    @patch('musicbrainz_mcp.server.get_client')
-    async def test_search_release_tool(self, mock_get_client, client):
-        """Test search_release tool."""
-        mock_client = AsyncMock()
-        mock_client.search_release.return_value = MOCK_RELEASE_SEARCH_RESPONSE
-        mock_get_client.return_value = mock_client
-
-        result = await client.call_tool("search_release", {
-            "params": {
-                "query": "Abbey Road",
-                "limit": 5
-            }
-        })
-
-        assert result is not None
-        mock_client.search_release.assert_called_once_with(
-            query="Abbey Road",
-            limit=5,
-            offset=0  # Default value
-        )
-
-    @pytest.mark.asyncio
-    @patch('musicbrainz_mcp.server.get_client')
-    async def test_search_recording_tool(self, mock_get_client, client):
-        """Test search_recording tool."""
-        mock_client = AsyncMock()
-        mock_client.search_recording.return_value = MOCK_RECORDING_SEARCH_RESPONSE
-        mock_get_client.return_value = mock_client
-
-        result = await client.call_tool("search_recording", {
-            "params": {
-                "query": "Come Together",
-                "limit": 15,
-                "offset": 10
-            }
-        })
+        assert mock_client.calls[tool] == [((), {"query": query, **expected_paging})]
 
-        assert result is not None
-        mock_client.search_recording.assert_called_once_with(
-            query="Come Together",
-            limit=15,
-            offset=10
-        )
-
-    @pytest.mark.asyncio
-    @patch('musicbrainz_mcp.server.get_client')
-    async def test_get_artist_details_tool(self, mock_get_client, client):
+    async def test_get_artist_details_tool(self, inject_mb_client, client):
         """Test get_artist_details tool."""
-        mock_client = AsyncMock()
-        mock_client.lookup_artist.return_value = MOCK_ARTIST_BEATLES
-        mock_get_client.return_value = mock_client
+        mock_client = make_fake_mb_client(lookup_artist=MOCK_ARTIST_BEATLES)
+        inject_mb_client(mock_client)
 
         mbid = "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d"
         result = await client.call_tool("get_artist_details", {
@@ -150,18 +97,15 @@ class TestMCPServerTools:
         })
 
         assert result is not None
-        mock_client.lookup_artist.assert_called_once_with(
-            mbid=mbid,
-            inc=["releases", "recordings"]
-        )
-
-    @pytest.mark.asyncio
-    @patch('musicbrainz_mcp.server.get_client')
-    async def test_browse_artist_releases_tool(self, mock_get_client, client):
+        assert mock_client.calls["lookup_artist"] == [((), {
+            "mbid": mbid,
+            "inc": ["releases", "recordings"]
+        })]
+
+    async def test_browse_artist_releases_tool(self, inject_mb_client, client):
         """Test browse_artist_releases tool."""
-        mock_client = AsyncMock()
-        mock_client.browse_artist_releases.return_value = MOCK_ARTIST_RELEASES_BROWSE_RESPONSE
-        mock_get_client.return_value = mock_client
+        mock_client = make_fake_mb_client(browse_artist_releases=MOCK_ARTIST_RELEASES_BROWSE_RESPONSE)
+        inject_mb_client(mock_client)
 
         artist_mbid = "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d"
         result = await client.call_tool("browse_artist_releases", {
@@ -175,21 +119,18 @@ class TestMCPServerTools:
         })
 
         assert result is not None
-        mock_client.browse_artist_releases.assert_called_once_with(
-            artist_mbid=artist_mbid,
-            limit=20,
-            offset=0,
-            release_type=["album"],
-            release_status=["official"]
-        )
-
-    @pytest.mark.asyncio
-    @patch('musicbrainz_mcp.server.get_client')
-    async def test_lookup_by_mbid_tool(self, mock_get_client, client):
+        assert mock_client.calls["browse_artist_releases"] == [((), {
+            "artist_mbid": artist_mbid,
+            "limit": 20,
+            "offset": 0,
+            "release_type": ["album"],
+            "release_status": ["official"]
+        })]
+
+    async def test_lookup_by_mbid_tool(self, inject_mb_client, client):
         """Test lookup_by_mbid generic tool."""
-        mock_client = AsyncMock()
-        mock_client.lookup_by_mbid.return_value = MOCK_ARTIST_BEATLES
-        mock_get_client.return_value = mock_client
+        mock_client = make_fake_mb_client(lookup_by_mbid=MOCK_ARTIST_BEATLES)
+        inject_mb_client(mock_client)
 
         mbid = "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d"
         result = await client.call_tool("lookup_by_mbid", {
@@ -201,25 +142,17 @@ class TestMCPServerTools:
         })
 
         assert result is not None
-        mock_client.lookup_by_mbid.assert_called_once_with(
-            entity_type="artist",
-            mbid=mbid,
-            inc=["releases"]
-        )
+        assert mock_client.calls["lookup_by_mbid"] == [((), {
+            "entity_type": "artist",
+            "mbid": mbid,
+            "inc": ["releases"]
+        })]
 
 
 @pytest.mark.unit
 class TestMCPServerParameterValidation:
     """Test parameter validation in MCP server tools."""
 
-    @pytest_asyncio.fixture
-    async def client(self):
-        """Create test client."""
-        server = create_server()
-        async with Client(server) as client:
-            yield client
-
-    @pytest.mark.asyncio
     async def test_search_artist_invalid_parameters(self, client):
         """Test search_artist with invalid parameters."""
         # Test empty query
@@ -231,26 +164,33 @@ class TestMCPServerParameterValidation:
                 }
             })
 
-        # Test invalid limit
-        with pytest.raises(Exception):
-            await client.call_tool("search_artist", {
-                "params": {
-                    "query": "test",
-                    "limit": 0  # Invalid: must be >= 1
-                }
-            })
+    @pytest.mark.parametrize("params", [
+        {"query": "test", "limit": 0},  # Invalid: must be >= 1
+        {"query": "test", "limit": 101},  # Invalid: must be <= 100
+        {"query": "test", "limit": 10, "offset": -1},  # Invalid: must be >= 0
+    ], ids=["limit-too-low", "limit-too-high", "negative-offset"])
+    def test_search_params_invalid_paging(self, params):
+        """Test that search paging limits are enforced by the parameter model."""
+        with pytest.raises(ValidationError):
+            SearchParams(**params)
+
+    @pytest.mark.parametrize("params", [
+        {"artist_mbid": "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d", "limit": 0},
+        {"artist_mbid": "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d", "offset": -1},
+        {"limit": 10},  # Missing artist_mbid
+    ], ids=["limit-too-low", "negative-offset", "missing-mbid"])
+    def test_browse_params_invalid(self, params):
+        """Test that browse parameters are validated by the parameter model."""
+        with pytest.raises(ValidationError):
+            BrowseParams(**params)
+
+    def test_lookup_params_require_mbid(self):
+        """Test that lookup parameter models require an MBID."""
+        with pytest.raises(ValidationError):
+            LookupParams(inc=["releases"])
+        with pytest.raises(ValidationError):
+            GenericLookupParams(entity_type="artist")
 
-        # Test invalid offset
-        with pytest.raises(Exception):
-            await client.call_tool("search_artist", {
-                "params": {
-                    "query": "test",
-                    "limit": 10,
-                    "offset": -1  # Invalid: must be >= 0
-                }
-            })
-
-    @pytest.mark.asyncio
     async def test_get_artist_details_invalid_mbid(self, client):
         """Test get_artist_details with invalid MBID."""
         with pytest.raises(Exception):  # Should raise validation error
@@ -260,7 +200,6 @@ class TestMCPServerParameterValidation:
                 }
             })
 
-    @pytest.mark.asyncio
     async def test_lookup_by_mbid_invalid_entity_type(self, client):
         """Test lookup_by_mbid with invalid entity type."""
         with pytest.raises(Exception):  # Should raise validation error
@@ -276,21 +215,11 @@ class TestMCPServerParameterValidation:
 class TestMCPServerErrorHandling:
     """Test error handling in MCP server tools."""
 
-    @pytest_asyncio.fixture
-    async def client(self):
-        """Create test client."""
-        server = create_server()
-        async with Client(server) as client:
-            yield client
-
-    @pytest.mark.asyncio
-    @patch('musicbrainz_mcp.server.get_client')
-    async def test_musicbrainz_api_error_handling(self, mock_get_client, client):
+    async def test_musicbrainz_api_error_handling(self, inject_mb_client, client):
         """Test handling of MusicBrainz API errors."""
         # Setup mock client to raise MusicBrainzError
-        mock_client = AsyncMock()
-        mock_client.search_artist.side_effect = MusicBrainzError("API Error")
-        mock_get_client.return_value = mock_client
+        mock_client = make_fake_mb_client(search_artist=MusicBrainzError("API Error"))
+        inject_mb_client(mock_client)
 
         # Test that error is properly handled
         with pytest.raises(Exception):  # FastMCP should propagate the error
@@ -301,14 +230,11 @@ class TestMCPServerErrorHandling:
                 }
             })
 
-    @pytest.mark.asyncio
-    @patch('musicbrainz_mcp.server.get_client')
-    async def test_unexpected_error_handling(self, mock_get_client, client):
+    async def test_unexpected_error_handling(self, inject_mb_client, client):
         """Test handling of unexpected errors."""
         # Setup mock client to raise unexpected error
-        mock_client = AsyncMock()
-        mock_client.search_artist.side_effect = RuntimeError("Unexpected error")
-        mock_get_client.return_value = mock_client
+        mock_client = make_fake_mb_client(search_artist=RuntimeError("Unexpected error"))
+        inject_mb_client(mock_client)
 
         # Test that error is properly handled
         with pytest.raises(Exception):  # FastMCP should propagate the error
@@ -321,10 +247,11 @@ class TestMCPServerErrorHandling:
 
 
 @pytest.mark.unit
+@pytest.mark.xdist_group("server_singleton")
+@pytest.mark.usefixtures("reset_client")
 class TestMCPServerClientManagement:
     """Test MCP server client management."""
 
-    @pytest.mark.asyncio
     async def test_get_client_singleton(self):
         """Test that get_client returns singleton instance."""
         # Clear any existing client
@@ -338,98 +265,60 @@ class TestMCPServerClientManagement:
         # Should be the same instance
         assert client1 is client2
 
-    @pytest.mark.asyncio
-    async def test_get_client_configuration(self):
+    async def test_get_client_configuration(self, monkeypatch):
         """Test that get_client uses environment configuration."""
-        import os
-        import musicbrainz_mcp.server
-
         # Clear existing client
-        musicbrainz_mcp.server._client = None
+        monkeypatch.setattr("musicbrainz_mcp.server._client", None)
 
         # Set environment variables
-        os.environ["MUSICBRAINZ_USER_AGENT"] = "TestAgent/1.0"
-        os.environ["MUSICBRAINZ_RATE_LIMIT"] = "2.0"
-        os.environ["MUSICBRAINZ_TIMEOUT"] = "15.0"
+        monkeypatch.setenv("MUSICBRAINZ_USER_AGENT", "TestAgent/1.0")
+        monkeypatch.setenv("MUSICBRAINZ_RATE_LIMIT", "2.0")
+        monkeypatch.setenv("MUSICBRAINZ_TIMEOUT", "15.0")
 
-        try:
-            client = await get_client()
+        client = await get_client()
 
-            # Verify configuration
-            assert client.user_agent == "TestAgent/1.0"
-            assert client.rate_limit == 2.0
-            assert client.timeout == 15.0
-
-        finally:
-            # Clean up environment variables
-            del os.environ["MUSICBRAINZ_USER_AGENT"]
-            del os.environ["MUSICBRAINZ_RATE_LIMIT"]
-            del os.environ["MUSICBRAINZ_TIMEOUT"]
-
-            # Clear client for other tests
-            musicbrainz_mcp.server._client = None
+        # Verify configuration
+        assert client.user_agent == "TestAgent/1.0"
+        assert client.rate_limit == 2.0
+        assert client.timeout == 15.0
 
 
 @pytest.mark.unit
 class TestMCPServerToolDescriptions:
     """Test that MCP server tools have proper descriptions."""
 
-    @pytest.mark.asyncio
-    async def test_tool_descriptions_present(self):
+    @pytest.mark.slow
+    def test_tool_descriptions_present(self, tool_list):
         """Test that all tools have descriptions."""
-        server = create_server()
-
-        async with Client(server) as client:
-            tools = await client.list_tools()
-
-            for tool in tools:
-                assert tool.description is not None
-                assert len(tool.description) > 0
-                # Check that descriptions contain music-related terms
-                description_lower = tool.description.lower()
-                has_music_terms = any(term in description_lower for term in [
-                    "musicbrainz", "music", "artist", "release", "recording", "mbid"
-                ])
-                assert has_music_terms, f"Tool {tool.name} description should contain music-related terms"
-
-    @pytest.mark.asyncio
-    async def test_tool_examples_in_descriptions(self):
+        for tool in tool_list:
+            assert tool.description is not None
+            assert len(tool.description) > 0
+            # Check that descriptions contain music-related terms
+            description_lower = tool.description.lower()
+            has_music_terms = _MUSIC_TERMS_RE.search(description_lower) is not None
+            assert has_music_terms, f"Tool {tool.name} description should contain music-related terms"
+
+    @pytest.mark.slow
+    def test_tool_examples_in_descriptions(self, tool_list):
         """Test that tool descriptions contain examples."""
-        server = create_server()
-
-        async with Client(server) as client:
-            tools = await client.list_tools()
+        for tool in tool_list:
+            # Most tools should have examples in their descriptions
+            description = tool.description.lower()
+            has_example = _EXAMPLE_RE.search(description) is not None
 
-            for tool in tools:
-                # Most tools should have examples in their descriptions
-                description = tool.description.lower()
-                has_example = any(keyword in description for keyword in [
-                    "example", "e.g.", "for example", "such as"
-                ])
-
-                # At least some tools should have examples
-                # We'll just check that descriptions are comprehensive
-                assert len(tool.description) > 50  # Reasonably detailed
+            # At least some tools should have examples
+            # We'll just check that descriptions are comprehensive
+            assert len(tool.description) > 50  # Reasonably detailed
 
 
 @pytest.mark.unit
 class TestMCPServerResponseFormat:
     """Test MCP server response formatting."""
 
-    @pytest_asyncio.fixture
-    async def client(self):
-        """Create test client."""
-        server = create_server()
-        async with Client(server) as client:
-            yield client
-
-    @pytest.mark.asyncio
-    @patch('musicbrainz_mcp.server.get_client')
-    async def test_search_response_format(self, mock_get_client, client):
+    async def test_search_response_format(self, inject_mb_client, client):
         """Test that search responses have consistent format."""
-        mock_client = AsyncMock()
-        mock_client.search_artist.return_value = MOCK_ARTIST_SEARCH_RESPONSE
-        mock_get_client.return_value = mock_client
+        mock_client = make_fake_mb_client(search_artist=MOCK_ARTIST_SEARCH_RESPONSE)
+        inject_mb_client(mock_client)
 
         result = await client.call_tool("search_artist", {
             "params": {
@@ -6,7 +6,6 @@ caching, response formatting, and configuration management.
 """
 
 import pytest
-import time
 import tempfile
 import json
 import os
@@ -25,34 +24,30 @@ from musicbrainz_mcp.config import (
 class TestMBIDUtils:
     """Test MBID utility functions."""
 
-    def test_validate_mbid_valid(self):
+    @pytest.mark.parametrize("mbid", [
+        "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
+        "B10BBBFC-CF9E-42E0-BE17-E2C3E1D2600D",  # Uppercase
+        "72c536dc-7137-4477-a521-567eeb840fa8",
+        "00000000-0000-0000-0000-000000000000",  # All zeros
+        "ffffffff-ffff-ffff-ffff-ffffffffffff",  # All f's
+    ])
+    def test_validate_mbid_valid(self, mbid):
         """Test validation of valid MBIDs."""
-        valid_mbids = [
-            "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
-            "B10BBBFC-CF9E-42E0-BE17-E2C3E1D2600D",  # Uppercase
-            "72c536dc-7137-4477-a521-567eeb840fa8",
-            "00000000-0000-0000-0000-000000000000",  # All zeros
-            "ffffffff-ffff-ffff-ffff-ffffffffffff",  # All f's
-        ]
-        
-        for mbid in valid_mbids:
-            assert MBIDUtils.validate_mbid(mbid), f"Should validate {mbid}"
-
-    def test_validate_mbid_invalid(self):
+        assert MBIDUtils.validate_mbid(mbid), f"Should validate {mbid}"
+
+    @pytest.mark.parametrize("mbid", [
+        "invalid-mbid",
+        "b10bbbfc-cf9e-42e0-be17",  # Too short
+        "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d-extra",  # Too long
+        "g10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",  # Invalid character
+        "",  # Empty
+        None,  # None
+        123,  # Not a string
+        "b10bbbfc_cf9e_42e0_be17_e2c3e1d2600d",  # Underscores instead of hyphens
+    ])
+    def test_validate_mbid_invalid(self, mbid):
         """Test validation of invalid MBIDs."""
-        invalid_mbids = [
-            "invalid-mbid",
-            "b10bbbfc-cf9e-42e0-be17",  # Too short
-            "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d-extra",  # Too long
-            "g10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",  # Invalid character
-            "",  # Empty
-            None,  # None
-            123,  # Not a string
-            "b10bbbfc_cf9e_42e0_be17_e2c3e1d2600d",  # Underscores instead of hyphens
-        ]
-        
-        for mbid in invalid_mbids:
-            assert not MBIDUtils.validate_mbid(mbid), f"Should not validate {mbid}"
+        assert not MBIDUtils.validate_mbid(mbid), f"Should not validate {mbid}"
 
     def test_normalize_mbid(self):
         """Test MBID normalization."""
@@ -83,6 +78,18 @@ class TestMBIDUtils:
         assert "f4a261d1-2a31-4d1a-b4b6-7d6e4c8f9a0b" in mbids  # Normalized to lowercase
         assert "72c536dc-7137-4477-a521-567eeb840fa8" in mbids
 
+    def test_extract_mbids_from_text_deduplicates(self):
+        """Test that repeated MBIDs are returned once, in order of first appearance."""
+        text = (
+            "72c536dc-7137-4477-a521-567eeb840fa8 b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d "
+            "72C536DC-7137-4477-A521-567EEB840FA8"
+        )
+
+        assert MBIDUtils.extract_mbids_from_text(text) == [
+            "72c536dc-7137-4477-a521-567eeb840fa8",
+            "b10bbbfc-cf9e-42e0-be17-e2c3e1d2600d",
+        ]
+
 
 @pytest.mark.unit
 class TestResponseFormatter:
@@ -144,33 +151,27 @@ class TestResponseFormatter:
 class TestQueryUtils:
     """Test query utility functions."""
 
-    def test_clean_query(self):
+    @pytest.mark.parametrize("input_query, expected", [
+        ("  The Beatles  ", "The Beatles"),
+        ("test   query", "test query"),
+        ("", ""),
+        ("   ", ""),
+        ("a" * 1001, "a" * 1000),  # Length limit
+    ], ids=["strip", "collapse-whitespace", "empty", "blank", "length-limit"])
+    def test_clean_query(self, input_query, expected):
         """Test query cleaning."""
-        test_cases = [
-            ("  The Beatles  ", "The Beatles"),
-            ("test   query", "test query"),
-            ("", ""),
-            ("   ", ""),
-            ("a" * 1001, "a" * 1000),  # Length limit
-        ]
-        
-        for input_query, expected in test_cases:
-            result = QueryUtils.clean_query(input_query)
-            assert result == expected
-
-    def test_escape_lucene_query(self):
+        assert QueryUtils.clean_query(input_query) == expected
+
+    @pytest.mark.parametrize("input_query, expected", [
+        ("simple query", "simple query"),
+        ("artist:The Beatles", "artist\\:The Beatles"),
+        ("test+query", "test\\+query"),
+        ("query-with-dash", "query\\-with\\-dash"),
+        ("query*with*wildcards", "query\\*with\\*wildcards"),
+    ])
+    def test_escape_lucene_query(self, input_query, expected):
         """Test Lucene query escaping."""
-        test_cases = [
-            ("simple query", "simple query"),
-            ("artist:The Beatles", "artist\\:The Beatles"),
-            ("test+query", "test\\+query"),
-            ("query-with-dash", "query\\-with\\-dash"),
-            ("query*with*wildcards", "query\\*with\\*wildcards"),
-        ]
-        
-        for input_query, expected in test_cases:
-            result = QueryUtils.escape_lucene_query(input_query)
-            assert result == expected
+        assert QueryUtils.escape_lucene_query(input_query) == expected
 
     def test_build_search_query(self):
         """Test building structured search queries."""
@@ -212,33 +213,36 @@ class TestCacheUtils:
 
     def test_cache_ttl_expiration(self):
         """Test cache TTL expiration."""
-        cache = CacheUtils(default_ttl=0.1)  # 100ms TTL
+        clock = [0.0]
+        cache = CacheUtils(default_ttl=0.1, time_func=lambda: clock[0])  # 100ms TTL
         
         cache.set("test_key", "test_value")
         assert cache.get("test_key") == "test_value"
         
-        # Wait for expiration
-        time.sleep(0.2)
+        # Advance past expiration
+        clock[0] += 0.2
         assert cache.get("test_key") is None
 
     def test_cache_custom_ttl(self):
         """Test cache with custom TTL."""
-        cache = CacheUtils(default_ttl=60)
+        clock = [0.0]
+        cache = CacheUtils(default_ttl=60, time_func=lambda: clock[0])
         
         cache.set("test_key", "test_value", ttl=0.1)
         assert cache.get("test_key") == "test_value"
         
-        time.sleep(0.2)
+        clock[0] += 0.2
         assert cache.get("test_key") is None
 
     def test_cache_cleanup_expired(self):
         """Test cleanup of expired entries."""
-        cache = CacheUtils(default_ttl=0.1)
+        clock = [0.0]
+        cache = CacheUtils(default_ttl=0.1, time_func=lambda: clock[0])
         
         cache.set("key1", "value1")
         cache.set("key2", "value2")
         
-        time.sleep(0.2)
+        clock[0] += 0.2
         
         # Add a non-expired entry
         cache.set("key3", "value3", ttl=60)
@@ -320,23 +324,18 @@ class TestURLUtils:
         url = URLUtils.build_api_url("https://api.example.com", "search")
         assert url == "https://api.example.com/search"
 
-    def test_build_api_url_with_params(self):
-        """Test URL building with parameters."""
-        params = {"q": "test query", "limit": 10, "offset": 0}
-        url = URLUtils.build_api_url("https://api.example.com", "search", params)
-        
-        assert "https://api.example.com/search" in url
-        assert "q=test%20query" in url
-        assert "limit=10" in url
-        assert "offset=0" in url
-
-    def test_build_api_url_with_list_params(self):
-        """Test URL building with list parameters."""
-        params = {"inc": ["releases", "recordings"], "limit": 10}
-        url = URLUtils.build_api_url("https://api.example.com", "artist", params)
-        
-        assert "inc=releases%2Brecordings" in url
-        assert "limit=10" in url
+    @pytest.mark.parametrize("endpoint, params, expected_parts", [
+        ("search", {"q": "test query", "limit": 10, "offset": 0},
+         ["https://api.example.com/search", "q=test%20query", "limit=10", "offset=0"]),
+        ("artist", {"inc": ["releases", "recordings"], "limit": 10},
+         ["inc=releases%2Brecordings", "limit=10"]),
+    ], ids=["params", "list-params"])
+    def test_build_api_url_with_params(self, endpoint, params, expected_parts):
+        """Test URL building with scalar and list parameters."""
+        url = URLUtils.build_api_url("https://api.example.com", endpoint, params)
+
+        for part in expected_parts:
+            assert part in url
 
     def test_extract_query_params(self):
         """Test extracting query parameters from URL."""